@@ -0,0 +1,30 @@
+"""Time to build each level, as the game does on every start and death,
+with the shared asset cache emptied first or kept warm.
+"""
+
+from benchmarks.common import time_calls, summarize
+from src.core.assetManager import AssetManager
+from src.core.level import LevelFactory
+
+ROUNDS = 10
+
+
+def build(name, cold):
+    """Build and tear down a level, optionally emptying the cache first."""
+    if cold:
+        AssetManager.clear()
+    level = LevelFactory.create(name)
+    level.destroy()
+
+
+def main():
+    for levelData in sorted(LevelFactory._metadata, key=lambda m: m.index):
+        print(levelData.name)
+        print("  cold cache", summarize(time_calls(build, [(levelData.name, True)] * ROUNDS)))
+        AssetManager.hits = AssetManager.misses = 0
+        print("  warm cache", summarize(time_calls(build, [(levelData.name, False)] * ROUNDS)))
+        print(f"  hit rate when warm {AssetManager.hit_rate():.0%}, {len(AssetManager.assets)} assets cached")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Cost per frame of finding which bullets hit which enemies, checking
+every pair with spritecollideany or going through the BroadPhase grid.
+"""
+
+import random
+import pygame
+from benchmarks.common import time_calls, summarize
+from src.core.broadPhase import BroadPhase
+
+FRAMES = 50
+COUNTS = [50, 200, 800]
+WORLD = 3200
+
+
+def scatter(count, size, rng):
+    """A group of count sprites of the given size at random positions."""
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rng.randrange(WORLD), rng.randrange(WORLD), size, size)
+        group.add(sprite)
+    return group
+
+
+def every_pair(enemies, bullets):
+    """Every enemy asks the whole bullet group, as Enemy.update used to."""
+    return [(enemy, pygame.sprite.spritecollideany(enemy, bullets)) for enemy in enemies]
+
+
+def broad_phase(enemies, phase):
+    """Rebuild the grid once, then every enemy asks it for the bullets it touches, as Enemy.update does."""
+    phase.update()
+    return [(enemy, next(iter(phase.query(enemy.rect, "bullets")), None)) for enemy in enemies]
+
+
+def main():
+    for count in COUNTS:
+        rng = random.Random(count)
+        enemies = scatter(count, 64, rng)
+        bullets = scatter(count, 8, rng)
+        phase = BroadPhase()
+        phase.add("enemies", enemies)
+        phase.add("bullets", bullets)
+        print(f"{count} enemies, {count} bullets")
+        print("  every pair ", summarize(time_calls(every_pair, [(enemies, bullets)] * FRAMES)))
+        print("  broad phase", summarize(time_calls(broad_phase, [(enemies, phase)] * FRAMES)))
+
+
+if __name__ == "__main__":
+    main()
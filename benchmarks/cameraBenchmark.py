@@ -0,0 +1,67 @@
+"""Cost per frame of drawing a level's sprites as the level grows,
+drawing every sprite or only the ones Camera.visible_sprites returns.
+The background, zoom and lighting passes of Camera.draw cost the same
+either way and are left out.
+"""
+
+import random
+import pygame
+from benchmarks.common import time_calls, summarize
+from src.core.camera import Camera
+import src.constants as c
+
+FRAMES = 50
+COUNTS = [100, 1000, 10000]
+WORLD = 12800
+
+
+class Box(pygame.sprite.Sprite):
+    """A sprite that draws a filled square."""
+
+    image = pygame.Surface((32, 32))
+
+    def __init__(self, pos):
+        super().__init__()
+        self.rect = pygame.Rect(pos, (32, 32))
+
+    def draw(self, surface, offset):
+        surface.blit(self.image, self.rect.move(offset))
+
+
+def scatter(count, rng):
+    """count Boxes at random positions in the world."""
+    return [Box((rng.randrange(WORLD), rng.randrange(WORLD))) for _ in range(count)]
+
+
+def draw_everything(camera):
+    """Draw every sprite sorted by depth, as Camera.draw used to."""
+    offset = -camera.offset + camera.internal_offset
+    sprites = camera.sprites() + camera.static_objects.sprites()
+    for sprite in sorted(sprites, key=lambda s : s.rect.centery):
+        sprite.draw(camera.internal_surface, offset)
+
+
+def draw_visible(camera):
+    """Draw only the sprites near the screen, as Camera.draw does."""
+    offset = -camera.offset + camera.internal_offset
+    view = camera.visible_rect().inflate(2 * c.CAMERA_CULL_MARGIN, 2 * c.CAMERA_CULL_MARGIN)
+    for sprite in camera.visible_sprites(view):
+        sprite.draw(camera.internal_surface, offset)
+
+
+def main():
+    for count in COUNTS:
+        rng = random.Random(count)
+        camera = Camera()
+        camera.target = pygame.Rect(WORLD // 2, WORLD // 2, 1, 1)
+        camera.update()
+        camera.add(scatter(count // 10, rng))
+        camera.add_static(scatter(count - count // 10, rng))
+        print(f"{count} sprites, {len(camera.visible_sprites(camera.visible_rect()))} on screen")
+        print("  every sprite", summarize(time_calls(draw_everything, [(camera,)] * FRAMES)))
+        print("  culled      ", summarize(time_calls(draw_visible, [(camera,)] * FRAMES)))
+        camera.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cost of testing a mover against the walls of a synthetic 10k wall map,
+scanning every wall as Player.update used to, querying a SpatialHash
+before and after merging the walls with utils.merge_rects, or testing
+one CollisionMask of every wall.
+"""
+
+import random
+import pygame
+import src.core.utils as utils
+from benchmarks.common import time_calls, summarize
+from src.core.spatialHash import SpatialHash
+from src.core.collisionMask import CollisionMask
+import src.constants as c
+
+WALLS = 10000
+MAP_TILES = 200
+QUERIES = 2000
+
+
+def synthetic_walls(rng):
+    """Random tile sized and wall strip rects spread over the map."""
+    walls = []
+    for _ in range(WALLS):
+        col = rng.randrange(MAP_TILES)
+        row = rng.randrange(MAP_TILES)
+        width = c.TILE_SIZE * rng.choice([1, 1, 1, 2, 4])
+        height = c.TILE_SIZE * rng.choice([1, 1, 1, 2, 4])
+        walls.append(pygame.Rect(col * c.TILE_SIZE, row * c.TILE_SIZE, width, height))
+    return walls
+
+
+def linear_collide(walls, rect):
+    """The loop Player.update ran before the spatial hash."""
+    for wall in walls:
+        if pygame.Rect.colliderect(wall, rect):
+            return wall
+    return None
+
+
+def main():
+    rng = random.Random(0)
+    walls = synthetic_walls(rng)
+    movers = [
+        (pygame.Rect(
+            rng.randrange(MAP_TILES * c.TILE_SIZE), rng.randrange(MAP_TILES * c.TILE_SIZE), 48, 64
+        ),)
+        for _ in range(QUERIES)
+    ]
+    print(f"{WALLS} walls on a {MAP_TILES}x{MAP_TILES} tile map")
+    print("  linear scan ", summarize(time_calls(lambda rect: linear_collide(walls, rect), movers)))
+    index = SpatialHash(walls)
+    print("  spatial hash", summarize(time_calls(index.collide, movers)))
+
+    merged = utils.merge_rects(walls)
+    print(f"merged into {len(merged)} walls")
+    print("  linear scan ", summarize(time_calls(lambda rect: linear_collide(merged, rect), movers)))
+    index = SpatialHash(merged)
+    print("  spatial hash", summarize(time_calls(index.collide, movers)))
+
+    size = (MAP_TILES + 4) * c.TILE_SIZE
+    mask = CollisionMask((size, size), walls)
+    print("collision mask")
+    print("  overlap     ", summarize(time_calls(mask.collide, movers)))
+    print("  query       ", summarize(time_calls(mask.query, movers)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Shared setup for the benchmark scripts.
+
+Benchmarks are run from the repository root, for example
+
+    python -m benchmarks.pathfindingBenchmark
+"""
+
+import os
+import time
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from src.core.level import LevelFactory
+from src.core.map import Map
+
+
+def shipped_maps():
+    """Yield (level name, Map) for every registered level."""
+    for levelData in sorted(LevelFactory._metadata, key=lambda m: m.index):
+        yield levelData.name, Map(levelData.imageFile, levelData.dataFile)
+
+
+def time_calls(func, args_list):
+    """Call func once per argument tuple and return the durations in microseconds."""
+    durations = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        durations.append((time.perf_counter() - start) * 1e6)
+    return durations
+
+
+def summarize(durations):
+    """Format mean, median and p95 of a list of durations in microseconds."""
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"mean {statistics.fmean(ordered):9.1f}us  "
+        f"median {statistics.median(ordered):9.1f}us  "
+        f"p95 {p95:9.1f}us"
+    )
@@ -0,0 +1,40 @@
+"""Tiles expanded per query by A* and Jump Point Search on every shipped
+level, with the time each takes on the same queries.
+"""
+
+import random
+import statistics
+from benchmarks.common import shipped_maps, time_calls, summarize
+
+QUERIES = 300
+
+
+def expansions(search, queries):
+    """Run every query and return how many tiles search expanded for each."""
+    counts = []
+    for src, dest in queries:
+        search.find_path(src, dest)
+        counts.append(search.expanded)
+    return counts
+
+
+def main():
+    rng = random.Random(0)
+    for name, levelMap in shipped_maps():
+        tiles = levelMap.navGrid.walkable_ids()
+        queries = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(QUERIES)]
+        print(f"{name}: {levelMap.width}x{levelMap.height} tiles, {len(tiles)} walkable")
+        for label, search in (
+            ("a*  ", levelMap.navGrid.pathfinder),
+            ("jps ", levelMap.jumpPointSearch)
+        ):
+            counts = expansions(search, queries)
+            print(
+                f"  {label} expanded mean {statistics.fmean(counts):7.1f}  "
+                f"max {max(counts):5d}  "
+                + summarize(time_calls(search.find_path, queries))
+            )
+
+
+if __name__ == "__main__":
+    main()
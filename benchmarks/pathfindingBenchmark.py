@@ -0,0 +1,83 @@
+"""Per-query latency of uncached A* (NavGrid.find_path), Map.find_jump_path
+and Map.find_room_path on every shipped level, and the per-frame cost of many
+chasers using A* or the shared flow field.
+
+The search Graph.dijkstra used before A* is reproduced below so both can
+be compared on identical queries.
+"""
+
+import queue
+import random
+from benchmarks.common import shipped_maps, time_calls, summarize
+
+QUERIES = 300
+FRAMES = 100
+CHASER_COUNTS = [1, 8, 32]
+
+
+def legacy_dijkstra(graph, src, dest):
+    """The original Graph.dijkstra, kept here only as a baseline."""
+    tovisit = []
+    pq = queue.PriorityQueue()
+    dist = {}
+    prev = {}
+    for k in graph.walkable_ids():
+        dist[k] = 0 if k == src else float('inf')
+        prev[k] = None
+        tovisit.append(k)
+    pq.put((dist[src], src))
+    while not pq.empty():
+        _, node = pq.get()
+        if node not in tovisit:
+            continue
+        if node == dest:
+            break
+        tovisit.remove(node)
+        for neighbor, weight in graph.neighbors(node):
+            if neighbor in tovisit:
+                alt = dist[node] + weight
+                if alt < dist[neighbor]:
+                    dist[neighbor] = alt
+                    prev[neighbor] = node
+                    pq.put((dist[neighbor], neighbor))
+    return dist, prev
+
+
+def chase_frames(levelMap, tiles, chasers, rng, planner):
+    """Replan every chaser once per frame while the player wanders."""
+    player = rng.choice(tiles)
+    frames = []
+    for _ in range(FRAMES):
+        player = rng.choice(levelMap.navGrid.neighbors(player))[0]
+        frames.append([(rng.choice(tiles), player) for _ in range(chasers)])
+    return time_calls(
+        lambda frame: [planner(src, dest) for src, dest in frame],
+        [(frame,) for frame in frames]
+    )
+
+
+def main():
+    rng = random.Random(0)
+    for name, levelMap in shipped_maps():
+        tiles = list(levelMap.navGrid.walkable_ids())
+        queries = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(QUERIES)]
+        print(f"{name}: {levelMap.width}x{levelMap.height} tiles, {len(tiles)} walkable")
+        print("  dijkstra ", summarize(time_calls(
+            lambda s, d: legacy_dijkstra(levelMap.navGrid, s, d), queries
+        )))
+        print("  a*       ", summarize(time_calls(levelMap.navGrid.find_path, queries)))
+        print("  jps      ", summarize(time_calls(levelMap.find_jump_path, queries)))
+        print("  rooms    ", summarize(time_calls(levelMap.find_room_path, queries)))
+        for chasers in CHASER_COUNTS:
+            print(f"  {chasers} chasers per frame")
+            print("    a*        ", summarize(chase_frames(
+                levelMap, tiles, chasers, random.Random(chasers), levelMap.navGrid.find_path
+            )))
+            print("    flow field", summarize(chase_frames(
+                levelMap, tiles, chasers, random.Random(chasers),
+                lambda s, d: levelMap.flow_route(s, d, 10)
+            )))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Total node expansions of A* and D* Lite over a scripted chase.
+
+On every level the player walks back and forth between two distant tiles,
+pausing at each end, while a chaser replans every tick and steps one tile
+along its route every other tick. Halfway through, every door on the level
+closes.
+"""
+
+import random
+import time
+from benchmarks.common import shipped_maps
+from src.core.dstarLite import DStarLite
+
+TICKS = 600
+PLAYER_STEP_TICKS = 3
+PAUSE_TICKS = 40
+CATCH_UP_TICKS = 2
+
+
+def player_script(levelMap, rng):
+    """Tile of the player on every tick of the chase."""
+    tiles = levelMap.navGrid.walkable_ids()
+    while True:
+        a, b = rng.choice(tiles), rng.choice(tiles)
+        leg = levelMap.find_path(a, b)
+        if len(leg) > 10:
+            break
+    script = []
+    while len(script) < TICKS:
+        for route in (leg, leg[::-1]):
+            for tile in route:
+                script.extend([tile] * PLAYER_STEP_TICKS)
+            script.extend([route[-1]] * PAUSE_TICKS)
+    return script[:TICKS]
+
+
+def chase(levelMap, script, start, planner, expansions):
+    """Run the chase, returning total expansions and seconds spent planning."""
+    for rect in levelMap.door_rects():
+        levelMap.on_door_toggled(rect, False)
+    enemy = start
+    total = 0
+    elapsed = 0.0
+    for tick, player in enumerate(script):
+        if tick == TICKS // 2:
+            for rect in levelMap.door_rects():
+                levelMap.on_door_toggled(rect, True)
+        begin = time.perf_counter()
+        route = planner(enemy, player)
+        elapsed += time.perf_counter() - begin
+        total += expansions()
+        if len(route) > 1 and tick % CATCH_UP_TICKS == 0:
+            enemy = route[1]
+    return total, elapsed
+
+
+def main():
+    for name, levelMap in shipped_maps():
+        rng = random.Random(name)
+        script = player_script(levelMap, rng)
+        start = max(
+            levelMap.navGrid.walkable_ids(),
+            key=lambda tile: len(levelMap.find_path(tile, script[0]))
+        )
+        dstar = DStarLite(levelMap.navGrid)
+        astarTotal, astarTime = chase(
+            levelMap, script, start, levelMap.navGrid.find_path,
+            lambda: levelMap.navGrid.pathfinder.expanded
+        )
+        dstarTotal, dstarTime = chase(
+            levelMap, script, start, dstar.plan,
+            lambda: dstar.expanded
+        )
+        print(f"{name}: {TICKS} replans")
+        print(f"  a*        {astarTotal:7d} expansions  {astarTime * 1000:7.1f}ms")
+        print(f"  d* lite   {dstarTotal:7d} expansions  {dstarTime * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
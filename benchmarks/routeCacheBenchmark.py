@@ -0,0 +1,60 @@
+"""Hit rate of the Map route cache for a pack of enemies chasing the
+player, at several cache capacities. Doors start open and close halfway,
+as in replanningBenchmark.
+"""
+
+import random
+import time
+from benchmarks.common import shipped_maps
+from benchmarks.replanningBenchmark import player_script, TICKS
+from src.core.routeCache import RouteCache
+
+ENEMIES = 8
+REPLAN_TICKS = 5
+CAPACITIES = [0, 16, 64, 256]
+
+
+def chase(levelMap, script, starts):
+    """Chase the scripted player, returning seconds spent in Map.find_path."""
+    for rect in levelMap.door_rects():
+        levelMap.on_door_toggled(rect, False)
+    enemies = list(starts)
+    routes = [[] for _ in enemies]
+    elapsed = 0.0
+    for tick, player in enumerate(script):
+        if tick == TICKS // 2:
+            for rect in levelMap.door_rects():
+                levelMap.on_door_toggled(rect, True)
+        for i, enemy in enumerate(enemies):
+            if tick % REPLAN_TICKS == 0:
+                begin = time.perf_counter()
+                routes[i] = levelMap.find_path(enemy, player)
+                elapsed += time.perf_counter() - begin
+            if len(routes[i]) > 1:
+                routes[i] = routes[i][1:]
+                enemies[i] = routes[i][0]
+    return elapsed
+
+
+def main():
+    for name, levelMap in shipped_maps():
+        rng = random.Random(name)
+        script = player_script(levelMap, rng)
+        reachable = [
+            tile for tile in levelMap.navGrid.walkable_ids()
+            if levelMap.navGrid.find_path(tile, script[0])
+        ]
+        starts = [rng.choice(reachable) for _ in range(ENEMIES)]
+        print(f"{name}: {ENEMIES} enemies replanning every {REPLAN_TICKS} ticks")
+        for capacity in CAPACITIES:
+            levelMap.routeCache = RouteCache(capacity, levelMap.width)
+            elapsed = chase(levelMap, script, starts)
+            cache = levelMap.routeCache
+            print(
+                f"  capacity {capacity:4d}  hit rate {cache.hit_rate():6.1%}  "
+                f"({cache.hits} hits, {cache.misses} misses)  {elapsed * 1000:7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
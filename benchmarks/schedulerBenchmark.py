@@ -0,0 +1,72 @@
+"""Frame time when many enemies replan on the same frame, searching
+synchronously or through the per-frame PathScheduler budget.
+"""
+
+import random
+import time
+import statistics
+from benchmarks.common import shipped_maps, summarize
+from src.core.pathScheduler import PathScheduler
+
+FRAMES = 240
+BURST_EVERY = 30
+ENEMY_COUNTS = [8, 32]
+
+
+def bursts(tiles, enemies, rng):
+    """Per frame list of (src, dest) requests, all enemies replanning together."""
+    frames = []
+    for frame in range(FRAMES):
+        if frame % BURST_EVERY == 0:
+            player = rng.choice(tiles)
+            frames.append([(rng.choice(tiles), player) for _ in range(enemies)])
+        else:
+            frames.append([])
+    return frames
+
+
+def run_sync(levelMap, frames):
+    """Search every request on the frame it is made."""
+    durations = []
+    for requests in frames:
+        start = time.perf_counter()
+        for src, dest in requests:
+            levelMap.navGrid.find_path(src, dest)
+        durations.append((time.perf_counter() - start) * 1e6)
+    return durations, [0] * sum(len(requests) for requests in frames)
+
+
+def run_scheduled(levelMap, frames):
+    """Queue every request and let the scheduler serve them within budget."""
+    scheduler = PathScheduler(levelMap.navGrid)
+    durations = []
+    latencies = []
+    for frame, requests in enumerate(frames):
+        start = time.perf_counter()
+        for src, dest in requests:
+            scheduler.request(
+                src, dest, lambda route, made=frame: latencies.append(current[0] - made)
+            )
+        current = [frame]
+        scheduler.update()
+        durations.append((time.perf_counter() - start) * 1e6)
+    return durations, latencies
+
+
+def main():
+    for name, levelMap in shipped_maps():
+        tiles = levelMap.navGrid.walkable_ids()
+        print(f"{name}: {levelMap.width}x{levelMap.height} tiles, {len(tiles)} walkable")
+        for enemies in ENEMY_COUNTS:
+            frames = bursts(tiles, enemies, random.Random(enemies))
+            print(f"  {enemies} enemies replanning together")
+            for label, run in (("sync     ", run_sync), ("scheduled", run_scheduled)):
+                durations, latencies = run(levelMap, frames)
+                print(
+                    f"    {label} frame {summarize(durations)}  max {max(durations):9.1f}us  "
+                    f"wait {statistics.fmean(latencies):4.1f} frames"
+                )
+
+
+if __name__ == "__main__":
+    main()
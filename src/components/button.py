@@ -40,6 +40,7 @@ class Button:
 		if self.image is None:
 			self.image = self.text
 		self.image_rect = self.image.get_rect(center=(self.pos))
+		self.hovering = False
 
 
 	def check_mouseover(self, mousePosition):
@@ -55,12 +56,17 @@ class Button:
 	def change_color(self, mousePosition):
 		"""Change color of button's text based on mouse position.
 
+		Returns True if the color changed.
+
 			mousePosition: Current position of player's mouse.
 		"""
-		if self.check_mouseover(mousePosition):
-			self.text = self.font.render(self.textInput, True, self.hoveringColor)
-		else:
-			self.text = self.font.render(self.textInput, True, self.baseColor)
+		hovering = self.check_mouseover(mousePosition)
+		if hovering == self.hovering:
+			return False
+		self.hovering = hovering
+		color = self.hoveringColor if hovering else self.baseColor
+		self.text = self.font.render(self.textInput, True, color)
+		return True
 
 	def handle_event(self, event):
 		"""Handle a click from the user."""
@@ -69,8 +75,15 @@ class Button:
 			self.onClick()
 
 	def update(self, mousePosition):
-		"""Update state of the button."""
-		self.change_color(mousePosition)
+		"""Update state of the button.
+
+		Returns True if the button needs to be redrawn.
+		"""
+		return self.change_color(mousePosition)
+
+	def bounding_rect(self):
+		"""Get the area of the screen the button draws to."""
+		return self.image_rect.union(self.text_rect)
 	
 	def draw(self, surface):
 		"""Draw the button to the surface.
@@ -149,11 +162,21 @@ class TextInput:
 				self.textBuffer += event.unicode
 
 	def update(self, mousePosition):
+		"""Update the border color.
+
+		Returns True if the text input needs to be redrawn.
+		"""
+		oldColor = self.color
 		if not self.active:
 			if self.check_mouseover(mousePosition):
 				self.color = self.hoverColor
 			else:
 				self.color = self.inactiveColor
+		return self.color != oldColor
+
+	def bounding_rect(self):
+		"""Get the area of the screen the text input draws to."""
+		return self.rect
 	
 	def draw(self, surface):
 		"""Draw the text input control."""
@@ -202,6 +225,9 @@ class ToggleButton(Button):
     def check_mouseover(self, mousePosition):
         return self.rect.collidepoint(mousePosition)
 
+    def bounding_rect(self):
+        return self.rect
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(pygame.mouse.get_pos()):
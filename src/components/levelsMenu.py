@@ -1,5 +1,6 @@
 import pygame
 import src.core.utils as utils
+from src.core.assetManager import AssetManager
 from src.components.button import Button
 from src.components.menu import Menu
 from src.core.gameStates import GameStates
@@ -9,8 +10,8 @@ class LevelsMenu(Menu):
     """Levels Menu"""
     def __init__(self, manager):
         super().__init__(manager)
-        self.playImage, _ = utils.load_png("Play.png")
-        self.backImage, _ = utils.load_png("Play.png")
+        self.playImage = AssetManager.get_image("Play.png")
+        self.backImage = AssetManager.get_image("Play.png")
         self.titleFont = utils.load_font("Monoton/Monoton-Regular.ttf", 60)
         self.titleTextImage = self.titleFont.render("Level Selection", True, "white")
         self.titleRect = self.titleTextImage.get_rect(center=(640, 150))
@@ -37,7 +38,7 @@ class LevelsMenu(Menu):
 
         self.rightArrow = pygame.transform.invert(
             pygame.transform.scale(
-                utils.load_png("rightArrow.png")[0],
+                AssetManager.get_image("rightArrow.png"),
                 (150, 150)
             )
         )
@@ -71,6 +72,14 @@ class LevelsMenu(Menu):
         self.currentIdx = (self.currentIdx + 1) % len(self.levels)
         self.reset_error()
 
+    def update(self):
+        super().update()
+        if self.showError and self.error_start_time:
+            elapsed = pygame.time.get_ticks() - self.error_start_time
+            if elapsed >= self.error_duration:
+                self.error_start_time = None
+                self.mark_dirty(self.errorTextRect)
+
     def reset_error(self):
         self.showError = False
         self.error_start_time = None 
@@ -81,11 +90,7 @@ class LevelsMenu(Menu):
         current_level = self.levels[self.currentIdx]
         current_level.draw(surface)
         if(self.showError and self.error_start_time):
-            elapsed = pygame.time.get_ticks() - self.error_start_time
-            if elapsed < self.error_duration:
-                surface.blit(self.errorTextImage, self.errorTextRect)
-            else:
-                self.error_start_time = None
+            surface.blit(self.errorTextImage, self.errorTextRect)
 
 
 class SelectLevel:
@@ -111,7 +116,7 @@ class SelectLevel:
         self.font = utils.load_font("SpaceMono/SpaceMono-Regular.ttf", 40)
         self.level_name = self.font.render(self.name, True, "white")
         self.name_rect = self.level_name.get_rect(center=(640, 550))
-        lockedImage, _ = utils.load_png("locked.png")
+        lockedImage = AssetManager.get_image("locked.png")
         self.scaled_image = pygame.transform.scale(lockedImage, (90, 128))
         self.lockedImage_rect = self.scaled_image.get_rect(center=(640,400))
     
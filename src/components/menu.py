@@ -4,13 +4,22 @@ import requests
 import json
 from pprint import pprint
 import src.core.utils as utils
+from src.core.assetManager import AssetManager
 import src.constants as c
 from src.components.button import Button, TextInput, ToggleButton
 from src.components.ui import KeyPromptControlBarUi, KeyPromptUi
 from src.core.gameStates import GameStates
 
 class Menu:
-    """Base class for all menus in the game."""
+    """Base class for all menus in the game.
+
+    Menus barely change between frames, so they keep track of which parts
+    of the screen need to be redrawn. The game loop only redraws those,
+    and waits for input while there are none.
+    """
+
+    # Events after which the whole menu is redrawn
+    RedrawEvents = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
 
     def __init__(self, manager):
         """Constructor.
@@ -18,18 +27,41 @@ class Menu:
             manager: The state manager driving the game.
         """
         self.manager = manager
-        self.backgroundImage, _ = utils.load_png("menu_background.png")
+        self.backgroundImage = AssetManager.get_image("menu_background.png")
         self.backgroundImage = pygame.transform.scale(self.backgroundImage, (c.SCREEN_HEIGHT, c.SCREEN_HEIGHT))
         self.controls = []
+        self.redrawAll = True
+        self.dirtyRects = []
+
+    def mark_dirty(self, rect=None):
+        """Redraw rect, or the whole screen if rect is None, on the next frame."""
+        if rect is None:
+            self.redrawAll = True
+        else:
+            self.dirtyRects.append(pygame.Rect(rect))
+
+    def dirty_rects(self):
+        """Get the rects to redraw this frame, or None to redraw the whole screen.
+
+        An empty list means nothing changed. Clears the rects.
+        """
+        rects = None if self.redrawAll else self.dirtyRects
+        self.redrawAll = False
+        self.dirtyRects = []
+        return rects
 
     def handle_event(self, event):
         """Handle discrete user input events."""
         [ctrl.handle_event(event) for ctrl in self.controls]
+        if event.type in Menu.RedrawEvents:
+            self.mark_dirty()
 
     def update(self):
         """Update the menu's state."""
         mouse_pos = pygame.mouse.get_pos()
-        [ctrl.update(mouse_pos) for ctrl in self.controls]
+        for ctrl in self.controls:
+            if ctrl.update(mouse_pos):
+                self.mark_dirty(ctrl.bounding_rect())
     
     def draw(self, surface):
         """Draw the menu to the surface."""
@@ -51,10 +83,10 @@ class MainMenu(Menu):
         self.titleTextImage = self.titleFont.render("EscapeCodes", True, "white")
         self.titleRect = self.titleTextImage.get_rect(center=(1000, 150))
 
-        self.playImage, _ = utils.load_png("Play.png")
-        self.optionImage, _ = utils.load_png("Play.png")
-        self.quitImage, _ = utils.load_png("Play.png")
-        self.backImage, _ = utils.load_png("Play.png")
+        self.playImage = AssetManager.get_image("Play.png")
+        self.optionImage = AssetManager.get_image("Play.png")
+        self.quitImage = AssetManager.get_image("Play.png")
+        self.backImage = AssetManager.get_image("Play.png")
         self.controls += [
             Button(self.playImage, pos=(1000, 300), textInput="Levels", onClick=self.onLevels),
             Button(self.optionImage, pos=(1000, 420), textInput="Options", onClick=self.onOption),
@@ -81,7 +113,7 @@ class OptionsMenu(Menu):
 
     def __init__(self, manager):
         super().__init__(manager)
-        self.backImage, _ = utils.load_png("Play.png")
+        self.backImage = AssetManager.get_image("Play.png")
         self.headingFont = utils.load_font("SpaceMono/SpaceMono-Regular.ttf", 30)
         self.controls += [
             Button(self.backImage, pos=(1000, 540), textInput="Back", onClick=self.onBack)
@@ -140,9 +172,9 @@ class OptionsMenu(Menu):
 
     def update(self):
         super().update()
-        self.WASDControls.update()
-        self.QEPControls.update()
-        self.SpaceControls.update()
+        for controlBar in (self.WASDControls, self.QEPControls, self.SpaceControls):
+            if controlBar.update():
+                self.mark_dirty(controlBar.rect)
 
     def onBack(self):
         self.manager.set_state(GameStates.Menu)
@@ -168,16 +200,20 @@ class PauseMenu(OptionsMenu):
         super().__init__(manager)
 
         # Customize the Back button
-        self.backImage, _ = utils.load_png("Play.png")
+        self.backImage = AssetManager.get_image("Play.png")
         self.controls = [control for control in self.controls if not isinstance(control, Button)]
         self.backButton = Button(self.backImage, pos=(1000, 600), textInput="Main Menu", onClick=self.onBack)
         self.controls.insert(0, self.backButton)  # Add back button first
 
         # Add Resume button
-        self.resumeImage, _ = utils.load_png("Play.png")
+        self.resumeImage = AssetManager.get_image("Play.png")
         self.resumeButton = Button(self.resumeImage, pos=(1000, 500), textInput="Resume", onClick=self.onResume)
         self.controls.insert(0, self.resumeButton)  # Insert resume before back button for UI order
 
+        pausedFont = utils.load_font("SpaceMono/SpaceMono-Regular.ttf", 50)
+        self.pausedText = pausedFont.render("Paused", True, "white")
+        self.pausedRect = self.pausedText.get_rect(center=(1000, 100))
+
     def onResume(self):
         """Handles resuming the game."""
         self.manager.set_state(GameStates.Game)  # Adjust to the correct in-game state name
@@ -191,10 +227,7 @@ class PauseMenu(OptionsMenu):
         """Draw pause menu including resume and back buttons."""
         super().draw(surface)
         # Optionally, draw a "Paused" heading
-        pausedFont = utils.load_font("SpaceMono/SpaceMono-Regular.ttf", 50)
-        pausedText = pausedFont.render("Paused", True, "white")
-        pausedRect = pausedText.get_rect(center=(1000, 100))
-        surface.blit(pausedText, pausedRect)
+        surface.blit(self.pausedText, self.pausedRect)
 
 
 class LoginMenu(Menu):
@@ -212,7 +245,7 @@ class LoginMenu(Menu):
         self.errorTextImage = self.headingFont.render("Error: not a valid username", True, 'red')
         self.errorTextRect = self.errorTextImage.get_rect(center=(1000, 450))
         self.showError = False
-        self.quitImage, _ = utils.load_png("Play.png")
+        self.quitImage = AssetManager.get_image("Play.png")
         self.controls += [
             TextInput(pos=(1000, 370), width=200, height=45, onSubmit=self.onEnter),
             Button(self.quitImage, pos=(1000, 540), textInput="Quit", onClick=self.onQuit)
@@ -287,8 +320,8 @@ class YouDiedMenu(Menu):
 
     def __init__(self, manager):
         super().__init__(manager)
-        self.retryImage, _ = utils.load_png("Play.png")
-        self.quitImage, _ = utils.load_png("Play.png")
+        self.retryImage = AssetManager.get_image("Play.png")
+        self.quitImage = AssetManager.get_image("Play.png")
         self.controls += {
             Button(self.retryImage, pos=(640, 300), textInput="RETRY", onClick=self.onRetry),
             Button(self.quitImage, pos=(640, 420), textInput="QUIT", onClick=self.onQuit)
@@ -4,6 +4,7 @@ slideshow.py
 
 import pygame
 import src.core.utils as utils
+from src.core.assetManager import AssetManager
 import src.constants as c
 
 class SlideshowUi:
@@ -15,7 +16,7 @@ class SlideshowUi:
         self.slideRect = self.slides[self.currentSlide].get_rect()
 
         self.rightArrow = pygame.transform.scale(
-            utils.load_png("rightArrow.png")[0],
+            AssetManager.get_image("rightArrow.png"),
             (50, 50)
         )
         self.leftArrow = pygame.transform.flip(self.rightArrow, True, False)
@@ -6,7 +6,7 @@ Individual ui components that live in screen space.
 import pygame
 from bs4 import BeautifulSoup
 from src.entities.problem import Parameter, Problem, ProblemFactory
-from src.core.spritesheet import SpriteSheet
+from src.core.assetManager import AssetManager
 from src.core.ecodeEvents import EcodeEvent, EventManager
 from src.core import utils
 from src import constants as c
@@ -24,7 +24,7 @@ class WasdUi:
             pos: Position of the ui instruction.
         """
         self.on_close = on_close
-        self.spritesheet = SpriteSheet("wasd.png", c.WASD_SHEET_METADATA)
+        self.spritesheet = AssetManager.get_spritesheet("wasd.png", c.WASD_SHEET_METADATA)
         self.currentFrame = 0
         self.image = self.spritesheet.get_image("press", self.currentFrame)
         self.rect = self.image.get_rect()
@@ -76,7 +76,7 @@ class KeyPromptUi:
         # Press key animation
         self.currentFrame = 0
         self.lastUpdate = pygame.time.get_ticks()
-        self.spritesheet = SpriteSheet(filename, fileMetadata)
+        self.spritesheet = AssetManager.get_spritesheet(filename, fileMetadata)
         self.image = self.spritesheet.get_image("press", self.currentFrame)
         self.imageRect = self.image.get_rect()
         self.imageRect.topleft = (0, 0)
@@ -104,12 +104,15 @@ class KeyPromptUi:
         self.internalSurface = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
 
     def update(self):
+        """Advance the animation, returning True if the frame changed."""
         if pygame.time.get_ticks() - self.lastUpdate >= self.spritesheet.cooldown("press"):
             self.currentFrame += 1
             if self.currentFrame == self.spritesheet.num_frames("press"):
                 self.currentFrame = 0
             self.image = self.spritesheet.get_image("press", self.currentFrame)
             self.lastUpdate = pygame.time.get_ticks()
+            return True
+        return False
 
     def draw(self, surface: pygame.Surface, offset=pygame.Vector2(0, 0)):
         self.internalSurface.fill((0, 0, 0, 0))
@@ -233,7 +236,8 @@ class KeyPromptControlBarUi:
         self.internalSurface = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
     
     def update(self):
-        [c.update() for c in self.controls]
+        """Advance the animations, returning True if any frame changed."""
+        return any([c.update() for c in self.controls])
 
     def draw(self, surface: pygame.Surface):
         self.internalSurface.fill((0, 0, 0, 0))
@@ -374,7 +378,7 @@ class PinPad:
                     else c.MD_KEY_SHEET_METADATA if size == "medium"
                         else c.LG_KEY_SHEET_METADATA
             )
-            self.spritesheet = SpriteSheet(filename, metadata)
+            self.spritesheet = AssetManager.get_spritesheet(filename, metadata)
             self.notPressedImage = self.spritesheet.get_image("press", 0)
             self.pressedImage = self.spritesheet.get_image("press", 1)
             self.imageRect = self.pressedImage.get_rect()
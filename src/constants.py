@@ -5,14 +5,34 @@ import pygame
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 800
 
-MAP_WIDTH = 40
-MAP_HEIGHT = 25
 TILE_SIZE = 64
+# Longest a screen with nothing changing waits for input before updating again
+IDLE_WAIT_MS = 100
 INIT_PLAYER_POS = (256, 256)
 ENEMY_SPEED = 1.5
 ENEMY_CHASE_SPEED = 0.7
 
-WALKABLE_TILES = [12, 31, 32, 33]
+# Budget for queued path searches each frame
+PATH_BUDGET_EXPANSIONS = 400
+PATH_BUDGET_MS = 2
+# Run enemy path searches on a worker thread instead
+BACKGROUND_PATHFINDING = False
+# Number of routes each map remembers
+ROUTE_CACHE_CAPACITY = 256
+
+# Most pixels any sprite moves in one frame, the player's dash speed
+BROAD_PHASE_MARGIN = 16
+
+# How far past a sprite's rect its draw may reach, e.g. key prompts and speech bubbles
+CAMERA_CULL_MARGIN = 4 * TILE_SIZE
+# Width and height of the pieces level backgrounds are cut into
+BACKGROUND_CHUNK_SIZE = 512
+# Number of images and sprite sheets shared between sprites
+ASSET_CACHE_CAPACITY = 64
+# Width and height of the atlas sheets small images are packed into
+ATLAS_SHEET_SIZE = 1024
+# Largest width or height of an image that is packed into the atlas
+ATLAS_MAX_IMAGE_SIZE = 512
 
 # Custom events
 LEVEL_ENDED = pygame.USEREVENT + 2
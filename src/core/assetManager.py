@@ -0,0 +1,71 @@
+"""
+assetManager.py
+Process wide cache of images and sprite sheets shared between sprites.
+"""
+
+from collections import OrderedDict
+import src.core.utils as utils
+import src.constants as c
+from src.core.spritesheet import SpriteSheet
+
+
+def freeze(value):
+    """Turn nested dicts and lists, like sprite sheet metadata, into a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    return value
+
+
+class AssetManager:
+    """Decodes each image and parses each sprite sheet once for the whole game.
+
+    Every door, computer and boss shows a key prompt built from the same
+    few sprite sheets, and a level is built again each time the player
+    dies. They all share the cached assets, which must therefore never
+    be drawn onto or otherwise modified. The least recently used asset
+    is dropped once more than capacity are cached; sprites still holding
+    it keep it alive.
+    """
+    capacity = c.ASSET_CACHE_CAPACITY
+    assets = OrderedDict()
+    hits = 0
+    misses = 0
+
+    def get(key, load):
+        """Get the asset cached under key, calling load to create it on a miss."""
+        asset = AssetManager.assets.get(key)
+        if asset is None:
+            AssetManager.misses += 1
+            asset = load()
+            AssetManager.assets[key] = asset
+            if len(AssetManager.assets) > AssetManager.capacity:
+                AssetManager.assets.popitem(last=False)
+        else:
+            AssetManager.hits += 1
+            AssetManager.assets.move_to_end(key)
+        return asset
+
+    def get_image(filename):
+        """Get the image in filename, loading it if it is not cached."""
+        return AssetManager.get(
+            ("image", filename),
+            lambda: utils.load_png(filename)[0]
+        )
+
+    def get_spritesheet(filename, metadata) -> SpriteSheet:
+        """Get the sprite sheet in filename parsed with metadata, parsing it if it is not cached."""
+        return AssetManager.get(
+            ("spritesheet", filename, freeze(metadata)),
+            lambda: SpriteSheet(filename, metadata)
+        )
+
+    def hit_rate():
+        """Returns the fraction of lookups that were hits."""
+        lookups = AssetManager.hits + AssetManager.misses
+        return AssetManager.hits / lookups if lookups else 0.0
+
+    def clear():
+        """Forget every asset, keeping the counters."""
+        AssetManager.assets.clear()
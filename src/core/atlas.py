@@ -0,0 +1,150 @@
+"""
+atlas.py
+Packs the small images of the game into a few large sheets.
+
+Build the atlas from the repository root with
+
+    python -m src.core.atlas
+
+and build it again whenever one of the packed images changes. Until
+then, images whose file no longer matches the atlas are loaded from
+their file.
+"""
+
+import json
+import sys
+from pathlib import Path
+import pygame
+import src.config as config
+import src.constants as c
+
+ATLAS_DIR = config.IMAGE_DIR / "atlas"
+MANIFEST_FILE = "atlas.json"
+
+
+def shelf_pack(sizes, sheetSize, padding=1):
+    """Place rects on as few sheets as possible, filling rows from the tallest rect down.
+
+    Returns a (sheet, x, y) placement for each size, in the order given.
+
+        sizes: list of (width, height), each at most sheetSize
+        sheetSize: width and height of a sheet in pixels
+        padding: gap in pixels kept between rects
+    """
+    placements = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    sheet = 0
+    x = y = shelfHeight = 0
+    for i in order:
+        width, height = sizes[i]
+        if width > sheetSize or height > sheetSize:
+            raise ValueError(f"A {width}x{height} image does not fit on a {sheetSize} sheet")
+        if x + width > sheetSize:
+            # Start a new shelf under the current one
+            x = 0
+            y += shelfHeight + padding
+            shelfHeight = 0
+        if y + height > sheetSize:
+            sheet += 1
+            x = y = shelfHeight = 0
+        placements[i] = (sheet, x, y)
+        x += width + padding
+        shelfHeight = max(shelfHeight, height)
+    return placements
+
+
+def atlas_sources(imageDir=config.IMAGE_DIR, maxSize=c.ATLAS_MAX_IMAGE_SIZE):
+    """Get the paths, relative to imageDir, of every image small enough to pack."""
+    sources = []
+    for path in sorted(Path(imageDir).rglob("*.png")):
+        if ATLAS_DIR in path.parents:
+            continue
+        width, height = pygame.image.load(path).get_size()
+        if width <= maxSize and height <= maxSize:
+            sources.append(path.relative_to(imageDir).as_posix())
+    return sources
+
+
+def build_atlas(sources, imageDir=config.IMAGE_DIR, outDir=ATLAS_DIR, sheetSize=c.ATLAS_SHEET_SIZE):
+    """Pack images into sheets and write them with a manifest of where each one went.
+
+        sources: image paths relative to imageDir
+        outDir: directory the sheets and manifest are written to
+    """
+    paths = [Path(imageDir) / source for source in sources]
+    images = [pygame.image.load(path) for path in paths]
+    placements = shelf_pack([image.get_size() for image in images], sheetSize)
+
+    sheetCount = max((sheet for sheet, _, _ in placements), default=-1) + 1
+    sheets = [pygame.Surface((sheetSize, sheetSize), pygame.SRCALPHA) for _ in range(sheetCount)]
+    manifest = {"sheets": [f"atlas{i}.png" for i in range(sheetCount)], "images": {}}
+    for source, path, image, (sheet, x, y) in zip(sources, paths, images, placements):
+        sheets[sheet].blit(image, (x, y))
+        stat = path.stat()
+        manifest["images"][source] = {
+            "sheet": sheet,
+            "rect": [x, y, *image.get_size()],
+            "size": stat.st_size,
+            "mtime": stat.st_mtime
+        }
+
+    outDir = Path(outDir)
+    outDir.mkdir(parents=True, exist_ok=True)
+    for name, sheet in zip(manifest["sheets"], sheets):
+        pygame.image.save(sheet, outDir / name)
+    with open(outDir / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+class Atlas:
+    """Looks up packed images in the atlas, if one was built.
+
+    Sheets are loaded the first time an image on them is asked for. An
+    image whose file changed since the atlas was built is not used, so an
+    edited image shows up without building the atlas again. Bundled
+    executables skip that check, since bundling does not keep file times.
+    """
+    directory = ATLAS_DIR
+    imageDir = config.IMAGE_DIR
+    manifest = None
+    sheets = {}
+
+    def get(filename):
+        """Get the packed image for a path relative to the image directory, or None if it is not packed."""
+        if Atlas.manifest is None:
+            manifestPath = config.resource_path(Atlas.directory / MANIFEST_FILE)
+            if manifestPath.exists():
+                with open(manifestPath) as f:
+                    Atlas.manifest = json.load(f)
+            else:
+                Atlas.manifest = {"sheets": [], "images": {}}
+        entry = Atlas.manifest["images"].get(Path(filename).as_posix())
+        if entry is None or Atlas.is_stale(filename, entry):
+            return None
+        sheet = entry["sheet"]
+        if sheet not in Atlas.sheets:
+            Atlas.sheets[sheet] = pygame.image.load(
+                config.resource_path(Atlas.directory / Atlas.manifest["sheets"][sheet])
+            ).convert_alpha()
+        return Atlas.sheets[sheet].subsurface(entry["rect"])
+
+    def is_stale(filename, entry):
+        """Returns True if the image's file changed since it was packed into the atlas."""
+        if getattr(sys, "frozen", False):
+            return False
+        path = config.resource_path(Atlas.imageDir / filename)
+        if not path.exists():
+            return False
+        stat = path.stat()
+        return stat.st_size != entry.get("size") or stat.st_mtime != entry.get("mtime")
+
+    def clear():
+        """Forget the loaded manifest and sheets, so they are read again on the next lookup."""
+        Atlas.manifest = None
+        Atlas.sheets = {}
+
+
+if __name__ == "__main__":
+    manifest = build_atlas(atlas_sources())
+    print(f"Packed {len(manifest['images'])} images onto {len(manifest['sheets'])} sheets in {ATLAS_DIR}")
@@ -0,0 +1,65 @@
+"""
+broadPhase.py
+Finds which moving sprites are close enough to collide.
+"""
+
+import src.constants as c
+from src.core.spatialHash import cell_range
+
+
+class BroadPhase():
+    """Grid of sprites by layer, rebuilt once per frame.
+
+    Sprites are registered by layer, e.g. "player", "doors" or "bullets",
+    through the groups that hold them. Each update buckets every sprite on
+    a uniform grid, padded by margin so a sprite that moves up to margin
+    pixels later in the frame is still found. Queries only test the
+    sprites sharing a cell with them, against their current rects.
+    """
+
+    def __init__(self, cellSize=c.TILE_SIZE * 2, margin=c.BROAD_PHASE_MARGIN):
+        """Constructor.
+
+            cellSize: width and height of a grid cell in pixels
+            margin: most pixels a sprite moves in one frame
+        """
+        self.cellSize = cellSize
+        self.margin = margin
+        self.layers = {}
+        self.cells = {}
+
+    def add(self, layer, sprites):
+        """Register a group of sprites under a layer name.
+
+            layer: name of the layer
+            sprites: pygame.sprite.Group or any iterable of sprites with a rect
+        """
+        self.layers.setdefault(layer, []).append(sprites)
+
+    def update(self):
+        """Bucket every registered sprite at its current position."""
+        cells = {}
+        padding = 2 * self.margin
+        for layer, groups in self.layers.items():
+            for group in groups:
+                for sprite in group:
+                    for col, row in cell_range(sprite.rect.inflate(padding, padding), self.cellSize):
+                        cells.setdefault((layer, col, row), []).append(sprite)
+        self.cells = cells
+
+    def query(self, rect, layer):
+        """Get the sprites of a layer whose rect overlaps rect."""
+        found = []
+        seen = set()
+        for col, row in cell_range(rect, self.cellSize):
+            for sprite in self.cells.get((layer, col, row), ()):
+                if sprite not in seen:
+                    seen.add(sprite)
+                    if sprite.rect.colliderect(rect):
+                        found.append(sprite)
+        return found
+
+    def near(self, sprite, layer):
+        """Get the sprites of a layer that sprite could touch if it moves up to margin pixels."""
+        padding = 2 * self.margin
+        return self.query(sprite.rect.inflate(padding, padding), layer)
@@ -1,8 +1,11 @@
 import pygame
 from src.core.ecodeEvents import EventManager, EcodeEvent
+from src.core.broadPhase import BroadPhase
+from src.core.depthOrder import DepthOrder, depth
 import src.constants as c
 import random
 import math
+import heapq
 
 
 class Camera(pygame.sprite.Group):
@@ -10,6 +13,7 @@ class Camera(pygame.sprite.Group):
 
     def __init__(self):
         """Constructor."""
+        self.depthOrder = DepthOrder()
         super().__init__()
         self.background = None
         self.offset = pygame.math.Vector2()
@@ -28,6 +32,7 @@ class Camera(pygame.sprite.Group):
         self.internal_offset = pygame.math.Vector2()
         self.internal_offset.x = self.internal_surface_size[0] // 2 - self.half_w
         self.internal_offset.y = self.internal_surface_size[1] // 2 - self.half_h
+        self.zoom_surface = pygame.Surface(self.internal_surface_size, pygame.SRCALPHA).convert_alpha()
         self.x_bound_distance = self.half_w
         self.y_bound_distance = self.half_h
 
@@ -46,6 +51,8 @@ class Camera(pygame.sprite.Group):
     
         # Lighting
         self.brightness = 0
+        self.overlay = pygame.Surface((c.SCREEN_WIDTH, c.SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.overlayColor = None
 
         # Event subscribers
         EventManager.subscribe(EcodeEvent.PLAYER_MOVED, self.set_target)
@@ -55,6 +62,12 @@ class Camera(pygame.sprite.Group):
 
         self.foreground_objects = pygame.sprite.Group()
         self.background_objects = pygame.sprite.Group()
+
+        # Viewport culling
+        self.static_objects = pygame.sprite.Group()
+        self.cullIndex = BroadPhase(margin=0)
+        self.cullIndex.add("static", self.static_objects)
+        self.staticRank = {}
     
     def reset(self):
         """Clears all sprites the camera is managing.
@@ -64,6 +77,30 @@ class Camera(pygame.sprite.Group):
         self.empty()
         self.foreground_objects.empty()
         self.background_objects.empty()
+        self.static_objects.empty()
+        self.cullIndex.update()
+        self.staticRank = {}
+
+    def add_static(self, *sprites):
+        """Add sprites that never move outside their rect when added.
+
+        They are drawn with the other sprites, but are indexed and sorted
+        by depth once here so drawing only looks at the ones near the
+        screen.
+        """
+        self.static_objects.add(*sprites)
+        self.cullIndex.update()
+        self.staticRank = {
+            sprite: rank for rank, sprite in enumerate(sorted(self.static_objects, key=depth))
+        }
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.depthOrder.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.depthOrder.remove(sprite)
     
     def destroy(self):
         self.reset()
@@ -131,25 +168,87 @@ class Camera(pygame.sprite.Group):
         elif event.type == c.LEFT_DANCE_FLOOR:
             self.dim = False
 
+    def zoom_rect(self):
+        """Get the part of the internal surface that ends up on screen at the current zoom."""
+        size = self.internal_surface_size_vector / max(self.zoom, 1)
+        rect = pygame.Rect(0, 0, math.ceil(size.x), math.ceil(size.y))
+        rect.center = self.internal_surface_size_vector / 2
+        return rect
+
+    def visible_rect(self):
+        """Get the world rect that ends up on screen at the current zoom."""
+        return self.zoom_rect().move(self.offset - self.internal_offset).inflate(2, 2)
+
+    def visible_sprites(self, view):
+        """Get the sprites overlapping view, in draw order.
+
+            view: pygame.Rect in world coordinates
+        """
+        self.depthOrder.update()
+        moving = [sprite for sprite in self.depthOrder if sprite.rect.colliderect(view)]
+        static = [
+            sprite for sprite in self.cullIndex.query(view, "static")
+            if self.static_objects.has(sprite)
+        ]
+        static.sort(key=self.staticRank.__getitem__)
+        return list(heapq.merge(moving, static, key=depth))
+
     def draw(self, surface):
-        """Draw the sprites belonging to the camera group to surface."""
-        # Draw to the camera's internal surface
+        """Draw the sprites belonging to the camera group to surface.
+
+        Sprites far enough off screen that nothing they draw can be seen
+        are skipped.
+        """
+        view = self.visible_rect().inflate(2 * c.CAMERA_CULL_MARGIN, 2 * c.CAMERA_CULL_MARGIN)
+        offset = -self.offset + self.internal_offset
+        zoomRect = self.zoom_rect()
+
+        # Draw to the part of the camera's internal surface that will be seen
+        self.internal_surface.set_clip(zoomRect)
         self.internal_surface.fill((0, 0, 0))
-        self.internal_surface.blit(self.background, -self.offset + self.internal_offset)
-        [obj.draw(self.internal_surface, -self.offset + self.internal_offset)
-         for obj in self.background_objects]
-        for sprite in sorted(self.sprites(), key=lambda s : s.rect.centery):
-            sprite.draw(self.internal_surface, -self.offset + self.internal_offset)
-        [obj.draw(self.internal_surface, -self.offset + self.internal_offset) 
-         for obj in self.foreground_objects]
+        self.background.draw(self.internal_surface, offset)
+        [obj.draw(self.internal_surface, offset)
+         for obj in self.background_objects if obj.rect.colliderect(view)]
+        for sprite in self.visible_sprites(view):
+            sprite.draw(self.internal_surface, offset)
+        [obj.draw(self.internal_surface, offset)
+         for obj in self.foreground_objects if obj.rect.colliderect(view)]
         
-        # Scale image to zoom level
-        scaled_surface = pygame.transform.scale(self.internal_surface, self.zoom * self.internal_surface_size_vector)
-        scaled_rect = scaled_surface.get_rect(center=(self.half_w, self.half_h))
-        surface.blit(scaled_surface, scaled_rect)
+        self.internal_surface.set_clip(None)
 
-        # Tweak lighting
-        dim_surface = pygame.Surface((c.SCREEN_WIDTH, c.SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        # Scale image to zoom level
+        if self.zoom > 1:
+            # Only the seen part is scaled, into a surface the size of the screen
+            pygame.transform.scale(
+                self.internal_surface.subsurface(zoomRect),
+                self.internal_surface_size,
+                self.zoom_surface
+            )
+            surface.blit(self.zoom_surface, self.internal_rect)
+        elif self.zoom == 1:
+            surface.blit(self.internal_surface, self.internal_rect)
+        else:
+            scaled_surface = pygame.transform.scale(self.internal_surface, self.zoom * self.internal_surface_size_vector)
+            scaled_rect = scaled_surface.get_rect(center=(self.half_w, self.half_h))
+            surface.blit(scaled_surface, scaled_rect)
+
+        self.draw_overlay(surface)
+
+    def draw_overlay(self, surface):
+        """Tint the screen for the blackout and alarm effects.
+
+        The overlay surface is only refilled when its colour changes, and
+        is not drawn at all while fully transparent.
+        """
         dimColor = self.alarmColor if self.alarmStart else (0, 0, 0)
-        dim_surface.fill((dimColor[0], dimColor[1], dimColor[2], self.brightness)) 
-        surface.blit(dim_surface, (0, 0))
\ No newline at end of file
+        alpha = min(int(self.brightness), 255)
+        if alpha <= 0:
+            return
+        if alpha == 255:
+            surface.fill(dimColor)
+            return
+        color = (dimColor[0], dimColor[1], dimColor[2], alpha)
+        if color != self.overlayColor:
+            self.overlay.fill(color)
+            self.overlayColor = color
+        surface.blit(self.overlay, (0, 0))
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+chunkedBackground.py
+A level's background image cut into square chunks.
+"""
+
+import pygame
+import src.constants as c
+from src.core.spatialHash import cell_range
+
+
+class ChunkedBackground():
+    """Background image stored as a grid of chunk surfaces.
+
+    The image is cut up once when the level loads and the whole image is
+    not kept, so drawing only blits the few chunks that overlap the part
+    of the surface being drawn to.
+    """
+
+    def __init__(self, image: pygame.Surface, chunkSize=c.BACKGROUND_CHUNK_SIZE):
+        """Constructor.
+
+            image: the full background image
+            chunkSize: width and height of a chunk in pixels
+        """
+        self.chunkSize = chunkSize
+        self.rect = image.get_rect()
+        self.chunks = {}
+        for col, row in cell_range(self.rect, chunkSize):
+            area = pygame.Rect(col * chunkSize, row * chunkSize, chunkSize, chunkSize).clip(self.rect)
+            self.chunks[(col, row)] = image.subsurface(area).copy()
+
+    def draw(self, surface: pygame.Surface, offset):
+        """Draw the chunks that land inside the surface's clip rect.
+
+            surface: surface to draw to
+            offset: where the image's top left corner goes on surface
+        """
+        # Truncated like blit does, so chunk edges line up
+        x, y = int(offset[0]), int(offset[1])
+        view = surface.get_clip().move(-x, -y).clip(self.rect)
+        if view.width <= 0 or view.height <= 0:
+            return
+        chunkSize = self.chunkSize
+        surface.fblits(
+            (self.chunks[cell], (cell[0] * chunkSize + x, cell[1] * chunkSize + y))
+            for cell in cell_range(view, chunkSize)
+        )
@@ -0,0 +1,72 @@
+"""
+collisionMask.py
+Bitmask of the static geometry of a map for overlap queries.
+"""
+
+import pygame
+from src.core.spatialHash import SpatialHash
+
+
+class CollisionMask():
+    """One pixel per bit mask of where the walls of a map are.
+
+    Walls are drawn into the mask once, so any query is a single overlap
+    test however many wall rects the map was drawn with. Shapes that are
+    not rects can be tested with collide_mask. The wall rects are also
+    kept in a SpatialHash for callers like slide_move that need them back,
+    and query only looks there when the mask shows a wall in the way.
+    """
+
+    def __init__(self, size, rects=()):
+        """Constructor.
+
+            size: (width, height) of the map in pixels
+            rects: iterable of pygame.Rect to mark as solid
+        """
+        self.mask = pygame.mask.Mask(size)
+        self.bounds = pygame.Rect((0, 0), size)
+        self.rectMasks = {}
+        self.index = SpatialHash()
+        for rect in rects:
+            self.add_rect(rect)
+
+    def add_rect(self, rect):
+        """Mark the pixels of a rect as solid."""
+        self.mask.draw(self.rect_mask(rect.size), rect.topleft)
+        self.index.insert(rect)
+
+    def rect_mask(self, size):
+        """Get a filled mask of the given size, reused between calls."""
+        if size not in self.rectMasks:
+            self.rectMasks[size] = pygame.mask.Mask(size, fill=True)
+        return self.rectMasks[size]
+
+    def collide_point(self, pos):
+        """Whether a point in world coordinates is inside a wall."""
+        x, y = int(pos[0]), int(pos[1])
+        width, height = self.mask.get_size()
+        return 0 <= x < width and 0 <= y < height and self.mask.get_at((x, y)) == 1
+
+    def collide(self, rect):
+        """Whether a rect in world coordinates overlaps a wall."""
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        return self.mask.overlap(self.rect_mask(rect.size), rect.topleft) is not None
+
+    def collide_mask(self, mask, topleft):
+        """Whether a mask placed with its top left corner at topleft overlaps a wall.
+
+            mask: pygame.mask.Mask, e.g. from pygame.mask.from_surface(sprite.image)
+            topleft: world position of the mask's top left corner
+        """
+        return self.mask.overlap(mask, (int(topleft[0]), int(topleft[1]))) is not None
+
+    def query(self, rect):
+        """Get the wall rects that may overlap rect, as SpatialHash.query does.
+
+        Returns an empty list without looking at the index when the mask
+        shows no wall inside rect.
+        """
+        if self.bounds.contains(rect) and not self.collide(rect):
+            return []
+        return self.index.query(rect)
@@ -0,0 +1,69 @@
+"""
+depthOrder.py
+Keeps sprites in the order they are drawn in, front to back by height.
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+def depth(sprite):
+    """Sprites lower on screen are drawn later, over the ones above them."""
+    return sprite.rect.centery
+
+
+class DepthOrder():
+    """Sprites sorted by rect.centery, kept sorted as they move.
+
+    Each sprite is stored with the depth it had when last placed. A sprite
+    is only moved within the list when its depth changed since then, by
+    taking it out and putting it back in with a binary search, so keeping
+    the order costs little when most sprites stand still.
+    """
+
+    def __init__(self, sprites=()):
+        """Constructor.
+
+            sprites: iterable of sprites with a rect
+        """
+        self.sprites = []
+        self.keys = []
+        self.depths = {}
+        for sprite in sprites:
+            self.add(sprite)
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def __iter__(self):
+        return iter(self.sprites)
+
+    def __contains__(self, sprite):
+        return sprite in self.depths
+
+    def add(self, sprite):
+        """Place a sprite after every sprite at or above its depth."""
+        key = depth(sprite)
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.sprites.insert(index, sprite)
+        self.depths[sprite] = key
+
+    def remove(self, sprite):
+        """Take a sprite out of the order."""
+        key = self.depths.pop(sprite)
+        index = bisect_left(self.keys, key)
+        while self.sprites[index] is not sprite:
+            index += 1
+        del self.keys[index]
+        del self.sprites[index]
+
+    def update(self):
+        """Move the sprites whose depth changed since they were placed.
+
+        Returns the number of sprites moved.
+        """
+        moved = [sprite for sprite, key in self.depths.items() if depth(sprite) != key]
+        for sprite in moved:
+            self.remove(sprite)
+            self.add(sprite)
+        return len(moved)
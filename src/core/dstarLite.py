@@ -0,0 +1,211 @@
+"""
+dstarLite.py
+Incremental replanning for sprites chasing a moving target.
+"""
+
+import heapq
+from src.core.pathfinding import octile_distance
+
+INF = float('inf')
+
+
+class DStarLite():
+    """D* Lite planner that keeps its search between calls.
+
+    The search is rooted at the goal, so when only the start moves (the
+    chaser walking its route) the previous search is reused through the
+    key modifier km. When the goal moves or tiles change walkability, only
+    the tiles whose cost-to-goal changed are repaired.
+    """
+
+    def __init__(self, graph):
+        """Constructor.
+
+            graph: Graph to search. Must expose width, changeLog,
+                is_walkable(node), neighbors(node) and grid_neighbors(node).
+        """
+        self.graph = graph
+        self.g = {}
+        self.rhs = {}
+        self.parent = {}
+        self.queue = []
+        self.queued = {}
+        self.start = -1
+        self.goal = -1
+        self.last = -1
+        self.km = 0.0
+        self.changesSeen = len(graph.changeLog)
+        self.expanded = 0
+
+    def reset(self, start, goal):
+        """Throw away the previous search and start a new one."""
+        self.g = {}
+        self.rhs = {goal: 0.0}
+        self.parent = {}
+        self.queue = []
+        self.queued = {}
+        self.start = start
+        self.last = start
+        self.goal = goal
+        self.km = 0.0
+        self.changesSeen = len(self.graph.changeLog)
+        self.push(goal)
+
+    def plan(self, start, goal):
+        """Find the shortest route from start to goal, reusing the last search.
+
+        Returns the list of tile ids from start to goal (both inclusive),
+        or an empty list if goal cannot be reached.
+
+            start: tile id of the chaser
+            goal: tile id being chased
+        """
+        self.expanded = 0
+        if not (self.graph.is_walkable(start) and self.graph.is_walkable(goal)):
+            return []
+
+        if self.goal == -1:
+            self.reset(start, goal)
+        else:
+            if start != self.start:
+                self.km += octile_distance(self.last, start, self.graph.width)
+                self.last = start
+                self.start = start
+            self.apply_graph_changes()
+            if goal != self.goal:
+                self.move_goal(goal)
+
+        self.compute_shortest_path()
+        return self.extract_route()
+
+    def move_goal(self, goal):
+        """Re-root the search at a new goal.
+
+        As in Moving Target D* Lite, tiles whose route to the old goal runs
+        through the new goal keep their values, everything else is cleared
+        and rebuilt from the edge of what was kept.
+        """
+        self.goal = goal
+        if self.rhs.get(goal, INF) == INF:
+            self.reset(self.start, goal)
+            return
+
+        children = {}
+        for node, parent in self.parent.items():
+            children.setdefault(parent, []).append(node)
+        kept = set()
+        stack = [goal]
+        while stack:
+            node = stack.pop()
+            if node in kept:
+                # Walkability changes can leave a loop of stale parents
+                continue
+            kept.add(node)
+            stack.extend(children.get(node, []))
+
+        deleted = [node for node in set(self.g) | set(self.rhs) if node not in kept]
+        for node in deleted:
+            self.g.pop(node, None)
+            self.rhs.pop(node, None)
+            self.parent.pop(node, None)
+            self.queued.pop(node, None)
+        self.parent.pop(goal, None)
+        self.rhs[goal] = 0.0
+        self.update_vertex(goal)
+        for node in deleted:
+            self.update_vertex(node)
+
+    def apply_graph_changes(self):
+        """Repair the tiles around every walkability change since the last call."""
+        changeLog = self.graph.changeLog
+        while self.changesSeen < len(changeLog):
+            for tile in changeLog[self.changesSeen]:
+                self.update_vertex(tile)
+                for neighbor, _ in self.graph.grid_neighbors(tile):
+                    self.update_vertex(neighbor)
+            self.changesSeen += 1
+
+    def key(self, node):
+        """Priority of node in the queue."""
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (
+            best + octile_distance(self.start, node, self.graph.width) + self.km,
+            best
+        )
+
+    def push(self, node):
+        """Queue node with its current key, replacing any older entry."""
+        key = self.key(node)
+        self.queued[node] = key
+        heapq.heappush(self.queue, (key[0], key[1], node))
+
+    def update_vertex(self, node):
+        """Recompute rhs of node and queue it if it became inconsistent."""
+        if not self.graph.is_walkable(node):
+            self.g.pop(node, None)
+            self.rhs.pop(node, None)
+            self.parent.pop(node, None)
+            self.queued.pop(node, None)
+            return
+        if node != self.goal:
+            g = self.g
+            best = INF
+            bestParent = None
+            for neighbor, weight in self.graph.neighbors(node):
+                cost = g.get(neighbor, INF) + weight
+                if cost < best:
+                    best = cost
+                    bestParent = neighbor
+            if bestParent is None:
+                self.rhs.pop(node, None)
+                self.parent.pop(node, None)
+            else:
+                self.rhs[node] = best
+                self.parent[node] = bestParent
+        self.queued.pop(node, None)
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self.push(node)
+
+    def compute_shortest_path(self):
+        """Process inconsistent tiles until the cost from start is known."""
+        g = self.g
+        rhs = self.rhs
+        queue = self.queue
+        while queue:
+            k1, k2, node = queue[0]
+            if self.queued.get(node) != (k1, k2):
+                heapq.heappop(queue)
+                continue
+            if (k1, k2) >= self.key(self.start) and \
+                    rhs.get(self.start, INF) == g.get(self.start, INF):
+                break
+            heapq.heappop(queue)
+            del self.queued[node]
+            self.expanded += 1
+
+            newKey = self.key(node)
+            if (k1, k2) < newKey:
+                self.push(node)
+            elif g.get(node, INF) > rhs.get(node, INF):
+                g[node] = rhs[node]
+                for neighbor, _ in self.graph.neighbors(node):
+                    self.update_vertex(neighbor)
+            else:
+                g[node] = INF
+                self.update_vertex(node)
+                for neighbor, _ in self.graph.neighbors(node):
+                    self.update_vertex(neighbor)
+
+    def extract_route(self):
+        """Follow the cheapest neighbours from start down to goal."""
+        if self.g.get(self.start, INF) == INF:
+            return []
+        route = [self.start]
+        node = self.start
+        while node != self.goal and len(route) <= self.graph.size:
+            node = min(
+                self.graph.neighbors(node),
+                key=lambda edge: self.g.get(edge[0], INF) + edge[1]
+            )[0]
+            route.append(node)
+        return route
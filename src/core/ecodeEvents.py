@@ -57,6 +57,8 @@ class EcodeEvent(Enum):
 
     LOAD_LEVEL = 40
 
+    DOOR_TOGGLED = 41
+
 
 class ScheduledEvent:
     def __init__(self, event: EcodeEvent, triggerTime: int, kwargs):
@@ -0,0 +1,163 @@
+"""
+jumpPointSearch.py
+Jump Point Search over the uniform cost tile grid.
+"""
+
+import heapq
+from src.core.navGrid import NEIGHBOR_OFFSETS
+from src.core.pathfinding import octile_distance
+
+
+class JumpPointSearch():
+    """A* that jumps along straight and diagonal lines of the grid.
+
+    On a uniform cost 8-connected grid most routes of equal cost are
+    symmetric, so instead of pushing every neighbour a search from a tile
+    only scans in the directions it was entered from. Scanning stops at
+    tiles with a forced neighbour, a tile that is only reached optimally
+    through the current one because a wall sits beside the line. Only those
+    jump points are put on the frontier, which keeps open rooms nearly free
+    to cross. Routes are as short as those of AStar.
+
+    Directions are indexes into NEIGHBOR_OFFSETS, so bit k of a NavGrid cell
+    tells whether the step in direction k is walkable.
+    """
+
+    def __init__(self, graph):
+        """Constructor.
+
+            graph: NavGrid to search
+        """
+        self.graph = graph
+        self.g = [0.0] * graph.size
+        self.parent = [-1] * graph.size
+        self.direction = [-1] * graph.size
+        self.seen = [0] * graph.size
+        self.closed = [0] * graph.size
+        self.searchId = 0
+        self.expanded = 0
+
+        directions = {(dx, dy): k for k, (dx, dy, _) in enumerate(NEIGHBOR_OFFSETS)}
+        self.offsets = [dy * graph.width + dx for dx, dy, _ in NEIGHBOR_OFFSETS]
+        # forced[k] lists (blocked bit, direction) pairs: when the tile of the
+        # blocked bit is a wall, the step in direction is a forced neighbour.
+        self.forced = []
+        # straightParts[k] lists the straight directions a diagonal is made of
+        self.straightParts = []
+        for dx, dy, _ in NEIGHBOR_OFFSETS:
+            if dx == 0 or dy == 0:
+                sides = [(dy, dx), (-dy, -dx)]
+                self.forced.append([
+                    (1 << directions[(sx, sy)], directions[(dx + sx, dy + sy)])
+                    for sx, sy in sides
+                ])
+                self.straightParts.append([])
+            else:
+                self.forced.append([
+                    (1 << directions[(-dx, 0)], directions[(-dx, dy)]),
+                    (1 << directions[(0, -dy)], directions[(dx, -dy)])
+                ])
+                self.straightParts.append([directions[(dx, 0)], directions[(0, dy)]])
+
+    def find_path(self, src: int, dest: int) -> list[int]:
+        """Find the shortest route between two tiles.
+
+        Returns the list of every tile id from src to dest (both inclusive),
+        or an empty list if dest cannot be reached.
+
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        self.expanded = 0
+        if not (self.graph.is_walkable(src) and self.graph.is_walkable(dest)):
+            return []
+
+        self.searchId += 1
+        searchId = self.searchId
+        width = self.graph.width
+        cells = self.graph.cellList
+        g = self.g
+        parent = self.parent
+        direction = self.direction
+        seen = self.seen
+        closed = self.closed
+
+        g[src] = 0.0
+        parent[src] = -1
+        direction[src] = -1
+        seen[src] = searchId
+        frontier = [(octile_distance(src, dest, width), src)]
+        while frontier:
+            _, node = heapq.heappop(frontier)
+            if closed[node] == searchId:
+                continue
+            if node == dest:
+                return self.build_route(dest)
+            closed[node] = searchId
+            self.expanded += 1
+            nodeCost = g[node]
+            mask = cells[node]
+            for k in self.successor_directions(node, mask):
+                if not mask & (1 << k):
+                    continue
+                jumpPoint = self.jump(node, k, dest)
+                if jumpPoint == -1 or closed[jumpPoint] == searchId:
+                    continue
+                alt = nodeCost + octile_distance(node, jumpPoint, width)
+                if seen[jumpPoint] != searchId or alt < g[jumpPoint]:
+                    seen[jumpPoint] = searchId
+                    g[jumpPoint] = alt
+                    parent[jumpPoint] = node
+                    direction[jumpPoint] = k
+                    heapq.heappush(
+                        frontier,
+                        (alt + octile_distance(jumpPoint, dest, width), jumpPoint)
+                    )
+        return []
+
+    def successor_directions(self, node: int, mask: int) -> list[int]:
+        """Directions worth scanning from node given the direction it was entered from."""
+        k = self.direction[node]
+        if k == -1:
+            return range(len(NEIGHBOR_OFFSETS))
+        return [k] + self.straightParts[k] + [
+            forcedDir for blocked, forcedDir in self.forced[k] if not mask & blocked
+        ]
+
+    def jump(self, node: int, k: int, dest: int) -> int:
+        """Scan from node in direction k for the next jump point.
+
+        Returns the tile id of the jump point or -1 if the scan hits a wall
+        or the edge of the map first.
+        """
+        cells = self.graph.cellList
+        offset = self.offsets[k]
+        bit = 1 << k
+        forced = self.forced[k]
+        straightParts = self.straightParts[k]
+        while cells[node] & bit:
+            node += offset
+            if node == dest:
+                return node
+            mask = cells[node]
+            for blocked, forcedDir in forced:
+                if not mask & blocked and mask & (1 << forcedDir):
+                    return node
+            for part in straightParts:
+                if self.jump(node, part, dest) != -1:
+                    return node
+        return -1
+
+    def build_route(self, dest: int) -> list[int]:
+        """Walk the parent links back from dest, filling in the tiles between jump points."""
+        route = []
+        node = dest
+        while self.parent[node] != -1:
+            prev = self.parent[node]
+            offset = self.offsets[self.direction[node]]
+            while node != prev:
+                route.append(node)
+                node -= offset
+        route.append(node)
+        route.reverse()
+        return route
@@ -3,8 +3,13 @@ from collections import deque
 from src.core.camera import Camera
 from src.entities.player import Player
 from src.entities.roomba import Roomba
+from src.entities.enemy import Enemy
 from src.entities.boss import Druck
 from src.core.map import Map
+from src.core.pathScheduler import PathScheduler
+from src.core.threadedPlanner import ThreadedPlanner
+from src.core.broadPhase import BroadPhase
+from src.core.triggers import TriggerIndex
 import src.constants as c
 from src.core.ecodeEvents import EventManager, EcodeEvent
 
@@ -14,27 +19,58 @@ class Level():
 
     def __init__(self, imageFile: str, dataFile: str):
         self.map = Map(imageFile, dataFile)
+        self.backgroundPlanner = (
+            ThreadedPlanner(self.map.navGrid) if c.BACKGROUND_PATHFINDING else None
+        )
         self.load_entities()
         self.start_level()
 
     def load_entities(self):
         self.objects = self.map.object_factory()
-        self.walls = self.map.walls_factory()
+        self.walls = self.map.collisionMask
         self.rooms, self.bossRoom = self.map.rooms_factory()
         self.doors = self.map.doors_factory()
+        self.pathScheduler = PathScheduler(self.map.navGrid)
 
         self.player = Player("Oldhero.png", self.map.playerSpawn, {})
         self.entities = pygame.sprite.Group()
         if self.bossRoom:
             boss = Druck(
                 self.bossRoom,
-                "two-sum"
+                "two-sum",
+                self.walls
             )
             self.entities.add(boss)
         if self.map.roombaPath:
             roomba = Roomba("roomba.png", self.map.roombaPath)
             self.set_roomba_dialog(roomba)
             self.entities.add(roomba)
+        self.enemies = pygame.sprite.Group()
+        for spawn in self.map.enemy_spawns():
+            self.enemies.add(
+                Enemy(
+                    spawn.get("image", "robot.png"),
+                    spawn["pos"],
+                    Enemy.PathStrategy[spawn.get("pathStrategy", "SEARCH")],
+                    scheduler=self.pathScheduler,
+                    backgroundPlanner=self.backgroundPlanner,
+                    walls=self.walls
+                )
+            )
+        # Nothing fires bullets yet
+        self.bullets = pygame.sprite.Group()
+
+        self.broadPhase = BroadPhase()
+        self.broadPhase.add("player", [self.player])
+        self.broadPhase.add("enemies", self.enemies)
+        self.broadPhase.add("bullets", self.bullets)
+        self.broadPhase.add("doors", self.doors)
+
+        self.triggers = TriggerIndex()
+        for sprite in [*self.objects, *self.doors, *self.entities]:
+            addTriggersOp = getattr(sprite, "add_triggers", None)
+            if callable(addTriggersOp):
+                addTriggersOp(self.triggers)
 
     # TODO: I think we can get rid of all destroy methods now
     def destroy(self):
@@ -44,6 +80,8 @@ class Level():
             if callable(destroyOp):
                 destroyOp()
         self.entities.empty()
+        if self.backgroundPlanner:
+            self.backgroundPlanner.shutdown()
     
     def set_roomba_dialog(self, roomba):
         pass
@@ -51,13 +89,14 @@ class Level():
     def load_camera(self, camera: Camera):
         camera.add(self.player)
         camera.add(self.entities)
-        camera.add(self.objects)
-        camera.add(self.doors)
+        camera.add(self.enemies)
+        camera.add_static(self.objects)
+        camera.add_static(self.doors)
 
         # camera.background_objects.add(self.map.background_objects)
 
         camera.target = self.player.rect
-        camera.background = self.map.image
+        camera.background = self.map.background
     
     def start_level(self):
         pass
@@ -67,10 +106,18 @@ class Level():
         self.load_camera(camera)
 
     def update(self):
-        self.player.update(self.walls, self.doors)
+        self.broadPhase.update()
+        self.player.update(
+            self.walls,
+            self.broadPhase.near(self.player, "doors")
+        )
+        self.triggers.update(self.player.rect)
         self.entities.update(self.player)
+        self.enemies.update(self.player, self.broadPhase, self.map)
+        self.pathScheduler.update()
         self.doors.update(self.player)
-        self.objects.update(self.player)
+        for obj in self.triggers.near(self.objects):
+            obj.update(self.player)
         
         # self.map.background_objects.update(self.player)
     
@@ -60,6 +60,13 @@ class GameManager:
     def draw(self, screen):
         self.activeState.draw(screen)
 
+    def dirty_rects(self):
+        """Get the rects the active state changed this frame, or None to redraw everything."""
+        dirtyRectsOp = getattr(self.activeState, "dirty_rects", None)
+        if callable(dirtyRectsOp):
+            return dirtyRectsOp()
+        return None
+
 
 class TextSlideShow:
     def __init__(self, manager):
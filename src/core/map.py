@@ -1,75 +1,19 @@
 import pygame
+import numpy as np
 import src.core.utils as utils
 import json
-import queue
 import src.entities.objects as o
 import src.constants as c
 import src.config as config
 from src.entities import computer as comp
-
-class Edge():
-    def __init__(self, id, weight):
-        self.id = id
-        self.weight = weight
-
-class Graph():
-    """Represents a graph. Used to model where sprites can move on map."""
-    
-    def __init__(self):
-        self.adj_list = {}
-
-    def populate(self, data):
-        for i in range(len(data)):
-            if data[i] in c.WALKABLE_TILES:
-                self.add_node(i, data)
-
-    def add_node(self, nodeid, data):
-        self.adj_list[nodeid] = []
-        neighbors = [
-            Edge(nodeid - c.MAP_WIDTH - 1, 1.4), 
-            Edge(nodeid - c.MAP_WIDTH + 1, 1.4), 
-            Edge(nodeid - c.MAP_WIDTH, 1), 
-            Edge(nodeid + c.MAP_WIDTH, 1), 
-            Edge(nodeid + c.MAP_WIDTH + 1, 1.4),
-            Edge(nodeid + c.MAP_WIDTH - 1, 1.4),
-            Edge(nodeid - 1, 1),
-            Edge(nodeid + 1, 1)
-        ] # walkable tiles are never on the edge
-        for n in neighbors:
-            if data[n.id] in c.WALKABLE_TILES:
-                self.adj_list[nodeid].append(n)
-    
-    def dijkstra(self, src, dest):
-        """Run dijkstras on graph, stopping when path to dest is found."""
-        tovisit = []
-        pq = queue.PriorityQueue()
-        dist = {}
-        prev = {}
-        for k in self.adj_list.keys():
-            if k == src:
-                dist[k] = 0
-            else:
-                dist[k] = float('inf')
-            prev[k] = None
-            tovisit.append(k)
-        pq.put((dist[src], src))
-        
-        while not pq.empty():
-            _, node = pq.get()
-            if node not in tovisit:
-                continue
-            if node == dest:
-                break
-            tovisit.remove(node)
-            for neighbor in self.adj_list[node]:
-                if neighbor.id in tovisit:
-                    alt = dist[node] + neighbor.weight
-                    if alt < dist[neighbor.id]:
-                        dist[neighbor.id] = alt
-                        prev[neighbor.id] = node
-                        pq.put((dist[neighbor.id], neighbor.id))
-        return dist, prev
-
+from src.core.pathfinding import FlowField
+from src.core.navGrid import NavGrid
+from src.core.jumpPointSearch import JumpPointSearch
+from src.core.roomGraph import RoomGraph
+from src.core.routeCache import RouteCache
+from src.core.collisionMask import CollisionMask
+from src.core.chunkedBackground import ChunkedBackground
+from src.core.ecodeEvents import EventManager, EcodeEvent
 
 class Map():
     """Parses exported map data from Tiled."""
@@ -80,8 +24,11 @@ class Map():
             imageFile: background of the map in .png format
             dataFile: map data exported from Tiled in .json format
         """
-        self.image, _ = utils.load_png(imageFile)
-        self.graph = Graph()
+        image, _ = utils.load_png(imageFile)
+        self.background = ChunkedBackground(image)
+        self.width = 0
+        self.height = 0
+        self.tileLayers = []
         self.walls = {}
         self.rooms = {}
         self.doors = {}
@@ -90,18 +37,45 @@ class Map():
         self.objects = {}
         self.playerSpawn = None
         self.roombaPath = None
+        self.enemies = {}
 
         self.load_json(dataFile)
         self.parse_doors()
         self.parse_objects()
 
+        self.collisionMask = CollisionMask(
+            (self.width * c.TILE_SIZE, self.height * c.TILE_SIZE),
+            utils.merge_rects(self.walls_factory())
+        )
+        self.navGrid = NavGrid(self.rasterize_walkable())
+        self.flowField = FlowField(self.navGrid)
+        self.jumpPointSearch = JumpPointSearch(self.navGrid)
+        self.routeCache = RouteCache(c.ROUTE_CACHE_CAPACITY, self.width)
+
+        rooms, _ = self.rooms_factory()
+        self.doorTiles = {
+            tuple(rect): self.tiles_in_rect(rect) for rect in self.door_rects()
+        }
+        self.closedDoors = set()
+        self.roomGraph = RoomGraph(
+            self.navGrid,
+            [self.tiles_in_rect(room) for room in rooms],
+            list(self.doorTiles.values())
+        )
+
+        EventManager.subscribe(EcodeEvent.DOOR_TOGGLED, self.on_door_toggled)
+
     def load_json(self, filename : str):
         """Load JSON data for the map."""
         f = open(config.resource_path(config.MAP_DIR / filename))
         self.rawJson = json.load(f)
+        self.width = self.rawJson["width"]
+        self.height = self.rawJson["height"]
         layers = self.rawJson["layers"]
         for layer in layers:
-            if layer["name"] == "walls":
+            if layer["type"] == "tilelayer":
+                self.tileLayers.append(layer["data"])
+            elif layer["name"] == "walls":
                 self.walls = layer
             elif layer["name"] == "rooms":
                 self.rooms = layer
@@ -109,6 +83,8 @@ class Map():
                 self.doors = layer
             elif layer["name"] == "objects":
                 self.objects = layer
+            elif layer["name"] == "enemies":
+                self.enemies = layer
             elif layer["name"] == "playerSpawn":
                 self.playerSpawn = (
                     layer["objects"][0]["x"],
@@ -256,6 +232,24 @@ class Map():
                 )
         return objectGroup
 
+    def enemy_spawns(self):
+        """Get where the enemies of this map start.
+
+        Returns a dict per enemy with its position under "pos" and any
+        properties set on it in Tiled, like "image" or "pathStrategy".
+        """
+        startX = self.enemies.get("x", 0)
+        startY = self.enemies.get("y", 0)
+        spawns = []
+        for enemy in self.enemies.get("objects", []):
+            spawn = {
+                property["name"]: property["value"]
+                for property in enemy.get("properties", [])
+            }
+            spawn["pos"] = (startX + enemy["x"], startY + enemy["y"])
+            spawns.append(spawn)
+        return spawns
+
     def walls_factory(self):
         """Generates the walls for this map as a list of rects."""
         startX = self.walls["x"]
@@ -290,6 +284,153 @@ class Map():
                 )
         return roomRects, bossRoom
 
+    def rasterize_walkable(self):
+        """Build a (height, width) bool array of where sprites can walk.
+        
+        A tile is walkable if any tile layer draws on it and no wall covers it.
+        """
+        # Tiled stores flip flags in the top bits of each gid
+        gids = np.array(self.tileLayers, dtype=np.uint32).reshape(-1, self.height, self.width)
+        walkable = np.any(gids & 0x1FFFFFFF, axis=0)
+        for wall in self.walls_factory():
+            rows, cols = self.tile_span(wall)
+            walkable[rows, cols] = False
+        return walkable
+
+    def tile_span(self, rect):
+        """Get the row and column slices of the tiles a rect in world coordinates overlaps."""
+        return (
+            slice(max(0, rect.top // c.TILE_SIZE), max(0, (rect.bottom - 1) // c.TILE_SIZE + 1)),
+            slice(max(0, rect.left // c.TILE_SIZE), max(0, (rect.right - 1) // c.TILE_SIZE + 1))
+        )
+
+    def tile_at(self, pos):
+        """Get the id of the tile containing a point in world coordinates.
+        
+        Returns -1 if the point is off the map.
+        """
+        row = int(pos[1] // c.TILE_SIZE)
+        col = int(pos[0] // c.TILE_SIZE)
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return -1
+        return row * self.width + col
+
+    def tile_center(self, tile):
+        """Get the center of a tile in world coordinates."""
+        row, col = divmod(tile, self.width)
+        return pygame.Vector2(
+            col * c.TILE_SIZE + c.TILE_SIZE / 2,
+            row * c.TILE_SIZE + c.TILE_SIZE / 2
+        )
+
+    def line_of_sight(self, a, b):
+        """Whether a straight line between two points in world coordinates
+        only crosses walkable tiles.
+
+            a, b: points in world coordinates
+        """
+        return self.navGrid.line_of_sight(
+            a[0] / c.TILE_SIZE, a[1] / c.TILE_SIZE,
+            b[0] / c.TILE_SIZE, b[1] / c.TILE_SIZE
+        )
+
+    def smooth_route(self, route):
+        """Reduce a route of tile ids to the tiles where it turns.
+
+            route: list of tile ids where each tile neighbours the next
+        """
+        return self.navGrid.smooth_route(route)
+
+    def tiles_in_rect(self, rect):
+        """Get the ids of walkable tiles overlapping a rect in world coordinates."""
+        rows, cols = self.tile_span(rect)
+        ids = np.arange(self.width * self.height).reshape(self.height, self.width)
+        return ids[rows, cols][self.navGrid.grid[rows, cols]].tolist()
+
+    def door_rects(self):
+        """Generates the laser door areas for this map as a list of rects."""
+        startX = self.doors["x"]
+        startY = self.doors["y"]
+        return [
+            pygame.Rect(
+                startX + laserDoor["x"],
+                startY + laserDoor["y"],
+                laserDoor["width"],
+                laserDoor["height"]
+            )
+            for laserDoor in self.laserDoors.values()
+        ]
+
+    def on_door_toggled(self, rect, toggle):
+        """Block or free the tiles under a door of this map.
+
+            rect: area of the door
+            toggle: True if the door is now closed
+        """
+        key = tuple(rect)
+        if key not in self.doorTiles or (key in self.closedDoors) == toggle:
+            return
+        if toggle:
+            self.closedDoors.add(key)
+        else:
+            self.closedDoors.discard(key)
+        self.navGrid.set_walkable(self.doorTiles[key], not toggle)
+        if toggle:
+            self.routeCache.invalidate_blocked(self.doorTiles[key])
+        else:
+            self.routeCache.invalidate_opened(self.doorTiles[key])
+        self.flowField.invalidate()
+        self.roomGraph.set_door_open(self.doorTiles[key], not toggle)
+
+    def find_path(self, src, dest):
+        """Find the shortest route of tile ids from src to dest.
+
+        Routes are cached, so the returned list must not be modified.
+
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        route = self.routeCache.get(src, dest)
+        if route is None:
+            route = self.navGrid.find_path(src, dest)
+            self.routeCache.put(src, dest, route)
+        return route
+
+    def find_jump_path(self, src, dest):
+        """Find the shortest route of tile ids from src to dest using Jump Point Search.
+
+        Gives routes as short as find_path while expanding far fewer tiles
+        in open rooms.
+
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        return self.jumpPointSearch.find_path(src, dest)
+
+    def find_room_path(self, src, dest):
+        """Find a route of tile ids from src to dest using the room graph.
+
+        Cheaper than find_path on large maps, and close to the shortest
+        route on maps split into rooms, see RoomGraph for the bound.
+
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        return self.roomGraph.find_path(src, dest)
+
+    def flow_route(self, src, goal, maxSteps):
+        """Follow the shared flow field from src towards goal.
+
+        Every caller chasing the same goal reuses one search, which only
+        reruns when goal changes.
+
+            src: tile id to start from
+            goal: tile id to reach
+            maxSteps: maximum number of steps to return
+        """
+        self.flowField.set_goal(goal)
+        return self.flowField.route(src, maxSteps)
+
     def draw(self, surface, offset):
         """Draw map background to surface."""
-        surface.blit(self.image, offset)
+        self.background.draw(surface, offset)
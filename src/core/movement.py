@@ -0,0 +1,45 @@
+"""
+movement.py
+Moving boxes through static walls without passing through them.
+"""
+
+import pygame
+
+
+def slide_move(box, movement, walls) -> pygame.Vector2:
+    """Sweep a box along movement, stopping at walls and sliding along them.
+
+    The walls near the whole sweep are fetched from the index once. The
+    move is then resolved one axis at a time: x first, stopping at the
+    first wall in the way, then y from where x ended. However far the box
+    moves in one call it cannot pass through a wall, and a blocked axis
+    does not stop the other one. Walls the box already overlaps are
+    ignored so it can always move out of them.
+
+    Returns the Vector2 the box actually moved by.
+
+        box: pygame.Rect or pygame.FRect at the start of the move
+        movement: Vector2 the box wants to move by
+        walls: SpatialHash or CollisionMask of wall rects
+    """
+    box = pygame.FRect(box)
+    dx, dy = movement
+    swept = box.union(box.move(dx, dy)).inflate(2, 2)
+    candidates = walls.query(pygame.Rect(swept))
+
+    if dx:
+        for wall in candidates:
+            if wall.top < box.bottom and wall.bottom > box.top:
+                if dx > 0 and wall.left >= box.right:
+                    dx = min(dx, wall.left - box.right)
+                elif dx < 0 and wall.right <= box.left:
+                    dx = max(dx, wall.right - box.left)
+        box.x += dx
+    if dy:
+        for wall in candidates:
+            if wall.left < box.right and wall.right > box.left:
+                if dy > 0 and wall.top >= box.bottom:
+                    dy = min(dy, wall.top - box.bottom)
+                elif dy < 0 and wall.bottom <= box.top:
+                    dy = max(dy, wall.bottom - box.top)
+    return pygame.Vector2(dx, dy)
@@ -0,0 +1,176 @@
+"""
+navGrid.py
+Compact grid of where sprites can walk on a map.
+"""
+
+import numpy as np
+from src.core.pathfinding import AStar, STRAIGHT_COST, DIAGONAL_COST
+
+# (dx, dy, weight) of the 8 tiles around a tile, bit k of a neighbour mask
+# is set when the tile at NEIGHBOR_OFFSETS[k] is walkable.
+NEIGHBOR_OFFSETS = [
+    (-1, -1, DIAGONAL_COST),
+    (1, -1, DIAGONAL_COST),
+    (0, -1, STRAIGHT_COST),
+    (0, 1, STRAIGHT_COST),
+    (1, 1, DIAGONAL_COST),
+    (-1, 1, DIAGONAL_COST),
+    (-1, 0, STRAIGHT_COST),
+    (1, 0, STRAIGHT_COST)
+]
+WALKABLE_BIT = 1 << len(NEIGHBOR_OFFSETS)
+NEIGHBOR_MASK = WALKABLE_BIT - 1
+
+
+class NavGrid():
+    """8-connected grid of walkable tiles backed by NumPy arrays.
+
+    Tiles are identified by their row-major id (row * width + col). Each
+    tile is packed into one uint16 cell: the low 8 bits flag which of its
+    neighbours are walkable and WALKABLE_BIT flags the tile itself, so
+    neighbour lookup is index arithmetic against a 256 entry table.
+    """
+
+    def __init__(self, grid):
+        """Constructor.
+
+            grid: 2D bool array of shape (height, width), True where walkable
+        """
+        self.grid = np.array(grid, dtype=bool)
+        self.height, self.width = self.grid.shape
+        self.size = self.width * self.height
+        self.changeLog = []
+        self.neighborTable = [
+            [
+                (dy * self.width + dx, weight)
+                for k, (dx, dy, weight) in enumerate(NEIGHBOR_OFFSETS)
+                if mask & (1 << k)
+            ]
+            for mask in range(WALKABLE_BIT)
+        ]
+        self.build_cells()
+        self.pathfinder = AStar(self)
+
+    def build_cells(self):
+        """Pack walkability and neighbour masks of every tile into self.cells."""
+        padded = np.pad(self.grid, 1)
+        cells = np.where(self.grid, WALKABLE_BIT, 0).astype(np.uint16)
+        for k, (dx, dy, _) in enumerate(NEIGHBOR_OFFSETS):
+            shifted = padded[1 + dy:1 + dy + self.height, 1 + dx:1 + dx + self.width]
+            cells |= (shifted & self.grid).astype(np.uint16) << k
+        self.cells = cells.ravel()
+        # Plain list copy for the per-tile lookups in the search loops,
+        # which are much slower on NumPy scalars.
+        self.cellList = self.cells.tolist()
+
+    def walkable_ids(self):
+        """Returns the ids of every walkable tile."""
+        return np.flatnonzero(self.grid).tolist()
+
+    def is_walkable(self, nodeid):
+        return 0 <= nodeid < self.size and self.cellList[nodeid] & WALKABLE_BIT != 0
+
+    def neighbors(self, nodeid):
+        """Returns list of (nodeid, weight) tuples of walkable tiles around nodeid."""
+        return [
+            (nodeid + offset, weight)
+            for offset, weight in self.neighborTable[self.cellList[nodeid] & NEIGHBOR_MASK]
+        ]
+
+    def grid_neighbors(self, nodeid):
+        """Returns (nodeid, weight) for every tile around nodeid that is on the map."""
+        row, col = divmod(nodeid, self.width)
+        neighbors = []
+        for dx, dy, weight in NEIGHBOR_OFFSETS:
+            neighborRow = row + dy
+            neighborCol = col + dx
+            if 0 <= neighborRow < self.height and 0 <= neighborCol < self.width:
+                neighbors.append((neighborRow * self.width + neighborCol, weight))
+        return neighbors
+
+    def walkable_at(self, col, row):
+        """Whether the tile at col, row is on the map and walkable."""
+        return (
+            0 <= col < self.width and 0 <= row < self.height
+            and self.cellList[row * self.width + col] & WALKABLE_BIT != 0
+        )
+
+    def line_of_sight(self, x0, y0, x1, y1):
+        """Whether the segment between two points only crosses walkable tiles.
+
+        Points are in tile units, so the centre of tile (col, row) is
+        (col + 0.5, row + 0.5). Every tile the segment touches is visited
+        with a DDA walk. A segment passing exactly through a tile corner
+        also needs both tiles beside the corner to be walkable.
+        """
+        col, row = int(x0), int(y0)
+        endCol, endRow = int(x1), int(y1)
+        dx, dy = x1 - x0, y1 - y0
+        stepX = 1 if dx > 0 else -1
+        stepY = 1 if dy > 0 else -1
+        deltaX = abs(1 / dx) if dx else float('inf')
+        deltaY = abs(1 / dy) if dy else float('inf')
+        nextX = ((col + 1 - x0) if dx > 0 else (x0 - col)) * deltaX if dx else float('inf')
+        nextY = ((row + 1 - y0) if dy > 0 else (y0 - row)) * deltaY if dy else float('inf')
+
+        remaining = abs(endCol - col) + abs(endRow - row)
+        if not self.walkable_at(col, row):
+            return False
+        while remaining > 0:
+            if abs(nextX - nextY) < 1e-9:
+                if not (self.walkable_at(col + stepX, row) and self.walkable_at(col, row + stepY)):
+                    return False
+                col += stepX
+                row += stepY
+                nextX += deltaX
+                nextY += deltaY
+                remaining -= 2
+            elif nextX < nextY:
+                col += stepX
+                nextX += deltaX
+                remaining -= 1
+            else:
+                row += stepY
+                nextY += deltaY
+                remaining -= 1
+            if not self.walkable_at(col, row):
+                return False
+        return True
+
+    def smooth_route(self, route):
+        """Drop the tiles of a route that can be skipped in a straight line.
+
+        Returns the first and last tiles of route and only the tiles in
+        between where the route has to turn around a wall.
+
+            route: list of tile ids where each tile neighbours the next
+        """
+        if len(route) < 3:
+            return list(route)
+        waypoints = [route[0]]
+        anchorRow, anchorCol = divmod(route[0], self.width)
+        for prev, tile in zip(route[1:], route[2:]):
+            row, col = divmod(tile, self.width)
+            if not self.line_of_sight(anchorCol + 0.5, anchorRow + 0.5, col + 0.5, row + 0.5):
+                waypoints.append(prev)
+                anchorRow, anchorCol = divmod(prev, self.width)
+        waypoints.append(route[-1])
+        return waypoints
+
+    def set_walkable(self, nodeids, walkable):
+        """Block or free tiles, e.g. when a door opens or closes.
+
+        Every call is recorded in changeLog so incremental planners can
+        catch up on what changed since they last looked.
+
+            nodeids: tile ids to change
+            walkable: whether sprites can now walk on those tiles
+        """
+        self.changeLog.append(list(nodeids))
+        rows, cols = np.divmod(np.asarray(nodeids, dtype=np.intp), self.width)
+        self.grid[rows, cols] = walkable
+        self.build_cells()
+
+    def find_path(self, src, dest):
+        """Find shortest route of tile ids from src to dest using A*."""
+        return self.pathfinder.find_path(src, dest)
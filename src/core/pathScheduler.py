@@ -0,0 +1,170 @@
+"""
+pathScheduler.py
+Spreads path searches of many sprites over several frames.
+"""
+
+import heapq
+import time
+import src.constants as c
+from src.core.pathfinding import octile_distance
+
+# Expansions run between two checks of the time budget
+SLICE_EXPANSIONS = 32
+
+
+class SearchTask():
+    """A* search from src to dest that can be paused and resumed.
+
+    Unlike AStar the search state lives in dictionaries owned by the task,
+    so any number of tasks can be in flight at once. If the graph changes
+    while the task is paused, it starts over on its next step.
+    """
+
+    def __init__(self, graph, src, dest):
+        """Constructor.
+
+            graph: NavGrid to search
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        self.graph = graph
+        self.src = src
+        self.dest = dest
+        self.callbacks = []
+        self.restart()
+
+    def restart(self):
+        """Throw away the search so far and start again from src."""
+        self.changesSeen = len(self.graph.changeLog)
+        self.g = {self.src: 0.0}
+        self.parent = {self.src: -1}
+        self.closed = set()
+        self.frontier = [(octile_distance(self.src, self.dest, self.graph.width), self.src)]
+        self.route = []
+        self.done = not (
+            self.graph.is_walkable(self.src) and self.graph.is_walkable(self.dest)
+        )
+
+    def step(self, maxExpansions):
+        """Expand at most maxExpansions tiles.
+
+        Returns the number of tiles expanded. Once the search is over done
+        is set and route holds the tile ids from src to dest (both
+        inclusive), or an empty list if dest cannot be reached.
+        """
+        if len(self.graph.changeLog) != self.changesSeen:
+            self.restart()
+        if self.done:
+            return 0
+
+        width = self.graph.width
+        dest = self.dest
+        g = self.g
+        parent = self.parent
+        closed = self.closed
+        frontier = self.frontier
+        cells = self.graph.cellList
+        neighborTable = self.graph.neighborTable
+        expanded = 0
+        while frontier and expanded < maxExpansions:
+            _, node = heapq.heappop(frontier)
+            if node in closed:
+                continue
+            if node == dest:
+                self.done = True
+                self.route = self.build_route()
+                return expanded
+            closed.add(node)
+            expanded += 1
+            nodeCost = g[node]
+            for offset, weight in neighborTable[cells[node] & 0xFF]:
+                neighbor = node + offset
+                if neighbor in closed:
+                    continue
+                alt = nodeCost + weight
+                if alt < g.get(neighbor, float('inf')):
+                    g[neighbor] = alt
+                    parent[neighbor] = node
+                    heapq.heappush(
+                        frontier,
+                        (alt + octile_distance(neighbor, dest, width), neighbor)
+                    )
+        if not frontier:
+            self.done = True
+        return expanded
+
+    def build_route(self):
+        """Walk the parent links back from dest into a src to dest route."""
+        route = []
+        node = self.dest
+        while node != -1:
+            route.append(node)
+            node = self.parent[node]
+        route.reverse()
+        return route
+
+
+class PathScheduler():
+    """Queue of path requests served within a per-frame budget.
+
+    Sprites request a route and carry on with their old path until their
+    callback is called. Each frame update runs the queued searches in the
+    order they were requested until either the expansion or the time
+    budget is used up, pausing the current search to resume it on the next
+    frame. Requests for the same source and target tiles share one search.
+    """
+
+    def __init__(
+        self,
+        graph,
+        maxExpansions=c.PATH_BUDGET_EXPANSIONS,
+        maxTime=c.PATH_BUDGET_MS
+    ):
+        """Constructor.
+
+            graph: NavGrid to search
+            maxExpansions: tiles that may be expanded per frame
+            maxTime: milliseconds that may be spent searching per frame
+        """
+        self.graph = graph
+        self.maxExpansions = maxExpansions
+        self.maxTime = maxTime
+        self.tasks = {}
+        self.expanded = 0
+
+    def request(self, src, dest, callback):
+        """Queue a search for a route from src to dest.
+
+            src: tile id to start from
+            dest: tile id to reach
+            callback: called with the route, a list of tile ids from src to
+                dest or an empty list if dest cannot be reached
+        """
+        key = (src, dest)
+        if key not in self.tasks:
+            self.tasks[key] = SearchTask(self.graph, src, dest)
+        self.tasks[key].callbacks.append(callback)
+
+    def pending(self):
+        """Returns the number of searches waiting to finish."""
+        return len(self.tasks)
+
+    def update(self):
+        """Run queued searches until this frame's budget is used up."""
+        self.expanded = 0
+        deadline = time.perf_counter() + self.maxTime / 1000
+        while self.tasks and self.expanded < self.maxExpansions:
+            key, task = next(iter(self.tasks.items()))
+            self.expanded += task.step(
+                min(SLICE_EXPANSIONS, self.maxExpansions - self.expanded)
+            )
+            if task.done:
+                del self.tasks[key]
+                for callback in task.callbacks:
+                    callback(task.route)
+            if time.perf_counter() >= deadline:
+                break
+
+    def clear(self):
+        """Drop every queued search without calling back."""
+        self.tasks = {}
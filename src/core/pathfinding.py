@@ -0,0 +1,180 @@
+"""
+pathfinding.py
+Search algorithms that run over the walkable tiles of a map.
+"""
+
+import heapq
+
+STRAIGHT_COST = 1
+DIAGONAL_COST = 1.4
+
+
+def octile_distance(a: int, b: int, width: int) -> float:
+    """Octile distance between two tiles on an 8-connected grid.
+
+        a, b: tile ids
+        width: number of tiles in a row of the map
+    """
+    dx = abs(a % width - b % width)
+    dy = abs(a // width - b // width)
+    if dx > dy:
+        return STRAIGHT_COST * (dx - dy) + DIAGONAL_COST * dy
+    return STRAIGHT_COST * (dy - dx) + DIAGONAL_COST * dx
+
+
+class AStar():
+    """A* search over a tile graph using an octile heuristic.
+
+    Search state lives in flat lists indexed by tile id which are allocated
+    once and reused between queries. Instead of clearing them each query,
+    every entry is stamped with the id of the search that wrote it.
+    """
+
+    def __init__(self, graph):
+        """Constructor.
+
+            graph: NavGrid to search
+        """
+        self.graph = graph
+        self.g = [0.0] * graph.size
+        self.parent = [-1] * graph.size
+        self.seen = [0] * graph.size
+        self.closed = [0] * graph.size
+        self.searchId = 0
+        self.expanded = 0
+
+    def find_path(self, src: int, dest: int) -> list[int]:
+        """Find the shortest route between two tiles.
+
+        Returns the list of tile ids from src to dest (both inclusive),
+        or an empty list if dest cannot be reached.
+
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        self.expanded = 0
+        if not (self.graph.is_walkable(src) and self.graph.is_walkable(dest)):
+            return []
+
+        self.searchId += 1
+        searchId = self.searchId
+        width = self.graph.width
+        g = self.g
+        parent = self.parent
+        seen = self.seen
+        closed = self.closed
+        cells = self.graph.cellList
+        neighborTable = self.graph.neighborTable
+
+        g[src] = 0.0
+        parent[src] = -1
+        seen[src] = searchId
+        frontier = [(octile_distance(src, dest, width), src)]
+        while frontier:
+            _, node = heapq.heappop(frontier)
+            if closed[node] == searchId:
+                continue
+            if node == dest:
+                return self.build_route(dest)
+            closed[node] = searchId
+            self.expanded += 1
+            nodeCost = g[node]
+            # low byte of a NavGrid cell flags which neighbours are walkable
+            for offset, weight in neighborTable[cells[node] & 0xFF]:
+                neighbor = node + offset
+                if closed[neighbor] == searchId:
+                    continue
+                alt = nodeCost + weight
+                if seen[neighbor] != searchId or alt < g[neighbor]:
+                    seen[neighbor] = searchId
+                    g[neighbor] = alt
+                    parent[neighbor] = node
+                    heapq.heappush(
+                        frontier,
+                        (alt + octile_distance(neighbor, dest, width), neighbor)
+                    )
+        return []
+
+    def build_route(self, dest: int) -> list[int]:
+        """Walk the parent links back from dest into a src to dest route."""
+        route = []
+        node = dest
+        while node != -1:
+            route.append(node)
+            node = self.parent[node]
+        route.reverse()
+        return route
+
+
+class FlowField():
+    """Distance map from every walkable tile towards a single goal tile.
+
+    One reverse Dijkstra from the goal gives each tile the next tile to step
+    to, so any number of sprites chasing the same goal share a single search.
+    The field is only recomputed when the goal changes.
+    """
+
+    def __init__(self, graph):
+        """Constructor.
+
+            graph: Graph to search. Must expose size, is_walkable(node) and neighbors(node).
+        """
+        self.graph = graph
+        self.goal = -1
+        self.dist = [float('inf')] * graph.size
+        self.nextTile = [-1] * graph.size
+        self.expanded = 0
+
+    def set_goal(self, goal: int):
+        """Point the field towards goal, recomputing it if the goal moved.
+
+            goal: tile id every route should lead to
+        """
+        if goal == self.goal:
+            return
+        self.goal = goal
+        self.dist = [float('inf')] * self.graph.size
+        self.nextTile = [-1] * self.graph.size
+        self.expanded = 0
+        if not self.graph.is_walkable(goal):
+            return
+
+        dist = self.dist
+        nextTile = self.nextTile
+        neighbors = self.graph.neighbors
+        dist[goal] = 0.0
+        nextTile[goal] = goal
+        frontier = [(0.0, goal)]
+        while frontier:
+            nodeCost, node = heapq.heappop(frontier)
+            if nodeCost > dist[node]:
+                continue
+            self.expanded += 1
+            for neighbor, weight in neighbors(node):
+                alt = nodeCost + weight
+                if alt < dist[neighbor]:
+                    dist[neighbor] = alt
+                    nextTile[neighbor] = node
+                    heapq.heappush(frontier, (alt, neighbor))
+
+    def invalidate(self):
+        """Force the field to be recomputed, e.g. after the graph changed."""
+        self.goal = -1
+
+    def next_step(self, tile: int) -> int:
+        """Returns the tile to step to from tile, or -1 if the goal is unreachable."""
+        return self.nextTile[tile]
+
+    def route(self, tile: int, maxSteps: int) -> list[int]:
+        """Follow the field from tile for at most maxSteps steps.
+
+        Returns the list of tile ids starting at tile, or an empty list if
+        the goal is unreachable from tile.
+        """
+        if not (0 <= tile < self.graph.size) or self.nextTile[tile] == -1:
+            return []
+        route = [tile]
+        while len(route) <= maxSteps and tile != self.goal:
+            tile = self.nextTile[tile]
+            route.append(tile)
+        return route
@@ -0,0 +1,107 @@
+"""
+routeCache.py
+Remembers recently found routes between pairs of tiles.
+"""
+
+from collections import OrderedDict
+from src.core.pathfinding import octile_distance
+
+INF = float('inf')
+
+
+class RouteCache():
+    """Least recently used cache of routes keyed by (source tile, destination tile).
+
+    Each entry keeps the route and its cost. An index from tile to the
+    entries whose route crosses it lets a closing door drop only the routes
+    that pass through it. When a door opens, an entry is dropped only if a
+    route through the door could be cheaper, which the octile distance via
+    each door tile bounds from below.
+    """
+
+    def __init__(self, capacity, width):
+        """Constructor.
+
+            capacity: maximum number of routes kept
+            width: number of tiles in a row of the map
+        """
+        self.capacity = capacity
+        self.width = width
+        self.entries = OrderedDict()
+        self.tileIndex = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, src, dest):
+        """Returns the cached route from src to dest, or None on a miss."""
+        entry = self.entries.get((src, dest))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end((src, dest))
+        return entry[0]
+
+    def put(self, src, dest, route):
+        """Remember route from src to dest, evicting the least recently used route if full.
+
+            route: list of tile ids from src to dest, empty if unreachable
+        """
+        key = (src, dest)
+        self.discard(key)
+        if route:
+            cost = sum(octile_distance(a, b, self.width) for a, b in zip(route, route[1:]))
+        else:
+            cost = INF
+        self.entries[key] = (route, cost)
+        for tile in route:
+            self.tileIndex.setdefault(tile, set()).add(key)
+        if len(self.entries) > self.capacity:
+            self.discard(next(iter(self.entries)))
+
+    def discard(self, key):
+        """Forget the route stored under key, if any."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for tile in entry[0]:
+            keys = self.tileIndex[tile]
+            keys.discard(key)
+            if not keys:
+                del self.tileIndex[tile]
+
+    def invalidate_blocked(self, tiles):
+        """Drop the routes that cross any of tiles, e.g. after a door closed."""
+        stale = set()
+        for tile in tiles:
+            stale.update(self.tileIndex.get(tile, ()))
+        for key in stale:
+            self.discard(key)
+
+    def invalidate_opened(self, tiles):
+        """Drop the routes that a shortcut through tiles could improve, e.g. after a door opened.
+
+        Unreachable entries are always dropped.
+        """
+        if not tiles:
+            return
+        width = self.width
+        stale = [
+            (src, dest) for (src, dest), (_, cost) in self.entries.items()
+            if any(
+                octile_distance(src, tile, width) + octile_distance(tile, dest, width) < cost
+                for tile in tiles
+            )
+        ]
+        for key in stale:
+            self.discard(key)
+
+    def hit_rate(self):
+        """Returns the fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Forget every route, keeping the counters."""
+        self.entries.clear()
+        self.tileIndex.clear()
@@ -0,0 +1,83 @@
+"""
+spatialHash.py
+Uniform grid index of static rects for fast overlap queries.
+"""
+
+import pygame
+import src.constants as c
+
+
+def cell_range(rect, cellSize):
+    """Yield the (col, row) of every grid cell of size cellSize that rect overlaps."""
+    for col in range(rect.left // cellSize, (rect.right - 1) // cellSize + 1):
+        for row in range(rect.top // cellSize, (rect.bottom - 1) // cellSize + 1):
+            yield col, row
+
+
+class SpatialHash():
+    """Buckets rects by the grid cells they overlap.
+
+    A query only looks at the rects in the cells its own rect overlaps, so
+    its cost depends on how crowded the area around it is rather than on
+    how many rects there are in total. Meant for rects that never move,
+    like walls, which are inserted once when a level loads.
+    """
+
+    def __init__(self, rects=(), cellSize=c.TILE_SIZE):
+        """Constructor.
+
+            rects: iterable of pygame.Rect to index
+            cellSize: width and height of a grid cell in pixels
+        """
+        self.cellSize = cellSize
+        self.rects = []
+        self.cells = {}
+        for rect in rects:
+            self.insert(rect)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def cell_range(self, rect):
+        """Yield the (col, row) of every cell rect overlaps."""
+        return cell_range(rect, self.cellSize)
+
+    def insert(self, rect):
+        """Add a rect to the index."""
+        rect = pygame.Rect(rect)
+        self.rects.append(rect)
+        for cell in self.cell_range(rect):
+            self.cells.setdefault(cell, []).append(rect)
+
+    def query(self, rect):
+        """Get the indexed rects sharing a cell with rect, without duplicates.
+
+        Some of them may not actually overlap rect.
+        """
+        cells = self.cells
+        candidates = []
+        seen = set()
+        for cell in self.cell_range(rect):
+            for other in cells.get(cell, ()):
+                if id(other) not in seen:
+                    seen.add(id(other))
+                    candidates.append(other)
+        return candidates
+
+    def collide(self, rect):
+        """Get an indexed rect that overlaps rect, or None if there is none."""
+        cells = self.cells
+        for cell in self.cell_range(rect):
+            bucket = cells.get(cell)
+            if bucket:
+                index = rect.collidelist(bucket)
+                if index != -1:
+                    return bucket[index]
+        return None
+
+    def collide_all(self, rect):
+        """Get every indexed rect that overlaps rect."""
+        return [other for other in self.query(rect) if rect.colliderect(other)]
@@ -36,23 +36,31 @@ class SpriteSheet():
         return image
 
     def parse_animations(self):
-        """Parses all animations from the sprite sheet into self.animations."""
+        """Parses all animations from the sprite sheet into self.animations.
+
+        Every frame is also kept mirrored horizontally, so sprites can
+        face either way without flipping a surface while drawing.
+        """
         for key, val in self.metadata["actions"].items():
             self.animations[key] = {}
             self.animations[key]["num_frames"] = val["num_frames"]
             self.animations[key]["images"] = []
+            self.animations[key]["flipped"] = []
             for i in range(val["num_frames"]):
-                self.animations[key]["images"].append(
-                    self.parse_frame(val["row"], i)
+                image = self.parse_frame(val["row"], i)
+                self.animations[key]["images"].append(image)
+                self.animations[key]["flipped"].append(
+                    pygame.transform.flip(image, True, False)
                 )
     
-    def get_image(self, action, frame) -> pygame.Surface:
+    def get_image(self, action, frame, flipped=False) -> pygame.Surface:
         """Returns the image for the given action and frame.
         
             action: str
             frame: int
+            flipped: whether to get the frame mirrored horizontally
         """
-        return self.animations[action]["images"][frame]
+        return self.animations[action]["flipped" if flipped else "images"][frame]
     
     def num_frames(self, action):
         """Returns the number of frames for this action.
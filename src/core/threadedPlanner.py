@@ -0,0 +1,79 @@
+"""
+threadedPlanner.py
+Runs path searches on a worker thread so they never stall a frame.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from src.core.navGrid import NavGrid
+from src.core.ecodeEvents import EventManager, EcodeEvent
+
+
+class ThreadedPlanner():
+    """Searches routes on a worker thread against a snapshot of the grid.
+
+    The worker never reads the live NavGrid. It searches a private copy,
+    taken again as soon as a door opens or closes, so the main thread can
+    keep changing the grid while searches run. Searches still queued when
+    that happens are cancelled, and routes planned on an older snapshot
+    are stale: result drops both and the caller should request a new route.
+    """
+
+    def __init__(self, graph):
+        """Constructor.
+
+            graph: NavGrid the routes are for
+        """
+        self.graph = graph
+        # A single worker, so only one search at a time uses a snapshot's AStar
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="planner")
+        self.pending = []
+        self.publish_snapshot()
+        # Subscribed after the Map, so the grid has changed by the time this is called
+        EventManager.subscribe(EcodeEvent.DOOR_TOGGLED, self.on_door_toggled)
+
+    def on_door_toggled(self, rect, toggle):
+        """Publish a new snapshot if the door changed the grid."""
+        if len(self.graph.changeLog) != self.version:
+            self.publish_snapshot()
+
+    def publish_snapshot(self):
+        """Copy the grid for upcoming searches and cancel the queued ones."""
+        self.version = len(self.graph.changeLog)
+        self.snapshot = NavGrid(self.graph.grid.copy())
+        for future in self.pending:
+            future.cancel()
+        self.pending = []
+
+    def submit(self, src, dest):
+        """Start searching for a route from src to dest.
+
+        Returns a Future to pass to result once it is done().
+
+            src: tile id to start from
+            dest: tile id to reach
+        """
+        if len(self.graph.changeLog) != self.version:
+            self.publish_snapshot()
+        self.pending = [future for future in self.pending if not future.done()]
+        future = self.executor.submit(self.snapshot.find_path, src, dest)
+        future.version = self.version
+        self.pending.append(future)
+        return future
+
+    def result(self, future):
+        """Get the route of a finished search.
+
+        Returns the list of tile ids from src to dest, an empty list if
+        dest cannot be reached, or None if the grid changed since the
+        search was submitted.
+
+            future: Future returned by submit that is done()
+        """
+        if future.cancelled() or future.version != len(self.graph.changeLog):
+            return None
+        return future.result()
+
+    def shutdown(self):
+        """Stop the worker thread, dropping any searches not yet started."""
+        EventManager.unsubscribe(EcodeEvent.DOOR_TOGGLED, self.on_door_toggled)
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,100 @@
+"""
+triggers.py
+Interaction zones that notice when the player walks in or out.
+"""
+
+import pygame
+import src.constants as c
+from src.core.spatialHash import cell_range
+
+
+class Trigger():
+    """A zone that calls back when the player enters or leaves it."""
+
+    def __init__(self, rect, onEnter=None, onExit=None, owner=None, contain=False):
+        """Constructor.
+
+            rect: pygame.Rect of the zone, kept by reference
+            onEnter: called with no arguments when the player enters
+            onExit: called with no arguments when the player leaves
+            owner: sprite the zone belongs to
+            contain: the player is only inside once its rect is entirely in the zone
+        """
+        self.rect = rect
+        self.onEnter = onEnter
+        self.onExit = onExit
+        self.owner = owner
+        self.contain = contain
+        self.inside = False
+
+    def test(self, rect):
+        """Whether a rect counts as inside the zone."""
+        if self.contain:
+            return self.rect.contains(rect)
+        return self.rect.colliderect(rect)
+
+
+class TriggerIndex():
+    """All the interaction zones of a level.
+
+    Zones that never move are bucketed on a uniform grid when added, so
+    each frame only the zones near the player are tested. Zones that move
+    with their owner, like the roomba's, are tested every frame. Owners
+    either get callbacks or read Trigger.inside instead of testing
+    rects against the player themselves.
+    """
+
+    def __init__(self, cellSize=c.TILE_SIZE * 2):
+        """Constructor.
+
+            cellSize: width and height of a grid cell in pixels
+        """
+        self.cellSize = cellSize
+        self.cells = {}
+        self.moving = []
+        self.inside = set()
+
+    def add(self, rect, onEnter=None, onExit=None, owner=None, contain=False, moving=False):
+        """Add a zone and return its Trigger.
+
+            moving: the zone's rect changes after it was added
+            See Trigger for the other arguments.
+        """
+        trigger = Trigger(rect, onEnter, onExit, owner, contain)
+        if moving:
+            self.moving.append(trigger)
+        else:
+            for cell in cell_range(rect, self.cellSize):
+                self.cells.setdefault(cell, []).append(trigger)
+        return trigger
+
+    def update(self, rect: pygame.Rect):
+        """Work out which zones the player is in, calling back those entered or left.
+
+            rect: the player's rect
+        """
+        now = set()
+        for cell in cell_range(rect, self.cellSize):
+            for trigger in self.cells.get(cell, ()):
+                if trigger.test(rect):
+                    now.add(trigger)
+        for trigger in self.moving:
+            if trigger.test(rect):
+                now.add(trigger)
+
+        for trigger in self.inside - now:
+            trigger.inside = False
+            if trigger.onExit:
+                trigger.onExit()
+        for trigger in now - self.inside:
+            trigger.inside = True
+            if trigger.onEnter:
+                trigger.onEnter()
+        self.inside = now
+
+    def near(self, group):
+        """Get the owners in group of the zones the player is in."""
+        return [
+            trigger.owner for trigger in self.inside
+            if trigger.owner is not None and trigger.owner in group
+        ]
@@ -1,13 +1,21 @@
 """Utility functions for loading assets and animations."""
 
 import pygame
+import numpy as np
 import platform
 import os
 import webbrowser
 import src.config as config
+from src.core.atlas import Atlas
 
 def load_png(filename):
-    """Load image and return image object."""
+    """Load image and return image object.
+
+    Images packed into the atlas are returned as subsurfaces of its sheets.
+    """
+    image = Atlas.get(filename)
+    if image is not None:
+        return image, image.get_rect()
     try:
         image = pygame.image.load(config.resource_path(config.IMAGE_DIR / filename))
         if image.get_alpha() is None:
@@ -103,4 +111,62 @@ def get_vector2(t: tuple) -> pygame.Vector2:
     
         t: Tuple to initialize from where t[0] = x and t[1] = y
     """
-    return pygame.Vector2(t[0], t[1])
\ No newline at end of file
+    return pygame.Vector2(t[0], t[1])
+
+def greedy_mesh(occupied: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """Cover the True cells of a 2D bool array with few rectangles.
+
+    Each rectangle grows right along its row as far as it can, then down
+    for as long as the whole span is occupied. Returns (top, left, bottom,
+    right) cell spans with exclusive bottom and right.
+    """
+    occupied = occupied.copy()
+    rows, cols = occupied.shape
+    spans = []
+    for row in range(rows):
+        for col in np.flatnonzero(occupied[row]):
+            if not occupied[row, col]:
+                continue
+            end = col + 1
+            while end < cols and occupied[row, end]:
+                end += 1
+            bottom = row + 1
+            while bottom < rows and occupied[bottom, col:end].all():
+                bottom += 1
+            occupied[row:bottom, col:end] = False
+            spans.append((row, int(col), bottom, end))
+    return spans
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Merge touching or overlapping rects into fewer rects covering the same area.
+
+    The rect edges split the plane into a grid of cells which is meshed
+    both row by row and column by column. The smaller result is returned,
+    or the rects unchanged if neither mesh has fewer rects.
+
+        rects: list of rects to merge
+    """
+    rects = [pygame.Rect(rect) for rect in rects if rect.width > 0 and rect.height > 0]
+    if not rects:
+        return []
+    xs = np.unique([edge for rect in rects for edge in (rect.left, rect.right)])
+    ys = np.unique([edge for rect in rects for edge in (rect.top, rect.bottom)])
+    occupied = np.zeros((len(ys) - 1, len(xs) - 1), dtype=bool)
+    for rect in rects:
+        occupied[
+            np.searchsorted(ys, rect.top):np.searchsorted(ys, rect.bottom),
+            np.searchsorted(xs, rect.left):np.searchsorted(xs, rect.right)
+        ] = True
+
+    byRow = greedy_mesh(occupied)
+    byColumn = [(top, left, bottom, right) for left, top, right, bottom in greedy_mesh(occupied.T)]
+    spans = min(byRow, byColumn, key=len)
+    if len(spans) >= len(rects):
+        return rects
+    return [
+        pygame.Rect(
+            int(xs[left]), int(ys[top]),
+            int(xs[right] - xs[left]), int(ys[bottom] - ys[top])
+        )
+        for top, left, bottom, right in spans
+    ]
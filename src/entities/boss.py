@@ -8,9 +8,12 @@ from enum import Enum
 from random import randint
 from src import constants as c
 from src.components.ui import KeyPromptUi
-from src.core.spritesheet import SpriteSheet
+from src.core.assetManager import AssetManager
 from src.core.ecodeEvents import EventManager, EcodeEvent
 from src.entities.player import Player
+from src.core.spatialHash import SpatialHash
+from src.core.collisionMask import CollisionMask
+from src.core.movement import slide_move
 
 class FiniteStateMachine():
     """Class to represent a simple finite state machine."""
@@ -132,16 +135,19 @@ class Boss(pygame.sprite.Sprite):
     def __init__(
         self,
         room: pygame.Rect,
-        problemSlug: str
+        problemSlug: str,
+        walls: CollisionMask | SpatialHash = None
     ):
         """Constructor.
 
             pos: Initial position of boss
             room: Boundaries of when boss fight is activated
             problemSlug: Url slug of problem this boss is associated with
+            walls: SpatialHash or CollisionMask of wall rects the boss cannot move through
         """
         super().__init__()
         self.room = room
+        self.walls = walls
         self.pos = pygame.Vector2(
             self.room.left + self.room.width / 2,
             self.room.top + self.room.height / 2
@@ -151,7 +157,7 @@ class Boss(pygame.sprite.Sprite):
         self.speed = 10
 
         # Animation variables
-        self.spritesheet = SpriteSheet("druck.png", c.DRUCK_SHEET_METADATA)
+        self.spritesheet = AssetManager.get_spritesheet("druck.png", c.DRUCK_SHEET_METADATA)
         self.action = "charge"
         self.currentFrame = 0
         self.lastUpdate = pygame.time.get_ticks()
@@ -161,6 +167,9 @@ class Boss(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.topleft = self.pos
         self.showKeyPrompt = False
+        self.promptRect = self.rect.inflate(50, 50)
+        self.promptZone = None
+        self.roomZone = None
         self.keyPromptUi = KeyPromptUi(pygame.K_t, "Keys/T-Key.png")
         self.keyPromptUi.rect.bottom = self.rect.top - 10
         self.keyPromptUi.rect.centerx = self.rect.centerx
@@ -191,6 +200,25 @@ class Boss(pygame.sprite.Sprite):
         # Event Subscriber
         EventManager.subscribe(EcodeEvent.HIT_BAR, self.hack)
 
+    def add_triggers(self, triggers):
+        """Add the zone the player can talk to the boss from and the zone that starts the fight.
+
+        The player is in the room once its rect is entirely past the first
+        tile inside the room's left edge.
+        """
+        self.promptZone = triggers.add(self.promptRect, owner=self, moving=True)
+        left = self.room.left + c.TILE_SIZE + 1
+        self.roomZone = triggers.add(
+            pygame.Rect(
+                left,
+                self.room.top - c.TILE_SIZE,
+                self.room.right + c.TILE_SIZE - left,
+                self.room.height + 2 * c.TILE_SIZE
+            ),
+            owner=self,
+            contain=True
+        )
+
     def start_dialog_enter(self):
         """Execute once upon entering dialog state."""
         EventManager.emit(EcodeEvent.OPEN_DIALOG, lines=["TODO: Set boss dialog"], currentLine=0)
@@ -220,8 +248,8 @@ class Boss(pygame.sprite.Sprite):
 
     def waiting_update(self, player: Player):
         """Update function to run when in waiting state."""
-        self.showKeyPrompt = self.rect.inflate(50, 50).colliderect(player.rect)
-        if self.room.left + c.TILE_SIZE < player.rect.left:
+        self.showKeyPrompt = self.promptZone.inside
+        if self.roomZone.inside:
             EventManager.emit(EcodeEvent.CLOSE_DOORS)
         
     def start_dialog_update(self, _):
@@ -290,7 +318,7 @@ class Boss(pygame.sprite.Sprite):
     def move(self, target: pygame.Vector2):
         """Move boss to the target point.
 
-        Returns true if target was reached.
+        Returns true if target was reached, or if a wall blocks the way.
         
             target: Vector2.
         """
@@ -306,12 +334,18 @@ class Boss(pygame.sprite.Sprite):
             self.face_right = True
 
         if distance >= self.speed:
-            self.pos += movement.normalize() * self.speed
+            step = movement.normalize() * self.speed
         else:
-            if distance != 0:
-                self.pos += movement.normalize() * distance
+            step = pygame.Vector2(movement)
             reached = True
+        if self.walls is not None and step:
+            moved = slide_move(pygame.FRect(self.pos, self.rect.size), step, self.walls)
+            if moved != step:
+                reached = True
+            step = moved
+        self.pos += step
         self.rect.topleft = self.pos
+        self.promptRect.center = self.rect.center
         return reached
 
     def destroy(self):
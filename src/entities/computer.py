@@ -35,10 +35,17 @@ class Computer(pygame.sprite.Sprite):
             if event.key == self.open_note_button and self.present_button:
                 self.computer_action()
 
+    def add_triggers(self, triggers):
+        """Add the zone the player can use the computer from."""
+        triggers.add(self.scaled_rect, onExit=self.on_player_left, owner=self)
+
+    def on_player_left(self):
+        self.present_button = False
+
     def update(self, player):
-        self.present_button = self.scaled_rect.colliderect(player.rect)
-        if self.present_button:
-            self.keyPromptUi.update()
+        """Only called by the level while the player is in range."""
+        self.present_button = True
+        self.keyPromptUi.update()
 
     def draw(self, surface, offset):
         if self.present_button:
@@ -2,20 +2,46 @@ import pygame
 import src.core.utils as utils
 import src.constants as c
 import src.entities.objects as o
-from src.core.spritesheet import SpriteSheet
+from src.core.assetManager import AssetManager
+from src.core.dstarLite import DStarLite
+from src.core.movement import slide_move
+from enum import Enum
 
 class Enemy(pygame.sprite.Sprite):
     """Represents an enemy."""
 
-    def __init__(self, image, pos):
+    class PathStrategy(Enum):
+        """How the enemy plans its path to the player."""
+        SEARCH = 0
+        FLOW_FIELD = 1
+        HIERARCHICAL = 2
+        INCREMENTAL = 3
+        JUMP_POINT = 4
+
+    def __init__(
+        self,
+        image,
+        pos,
+        pathStrategy=PathStrategy.FLOW_FIELD,
+        scheduler=None,
+        backgroundPlanner=None,
+        walls=None
+    ):
         """Constructor.
 
             image: enemy sprite PNG file.
+            pos: initial position of the enemy.
+            pathStrategy: Enemy.PathStrategy used to plan paths to the player.
+            scheduler: PathScheduler to queue PathStrategy.SEARCH searches on
+                instead of searching during update.
+            backgroundPlanner: ThreadedPlanner to run PathStrategy.SEARCH
+                searches on instead, takes precedence over scheduler.
+            walls: SpatialHash or CollisionMask of wall rects the enemy cannot walk through.
         """
         super().__init__()
 
         # Animation Variables
-        self.spritesheet = SpriteSheet(image, c.ENEMY_SHEET_METADATA)
+        self.spritesheet = AssetManager.get_spritesheet(image, c.ENEMY_SHEET_METADATA)
         self.action = "walk"
         self.current_frame = 0
         self.last_update = pygame.time.get_ticks()
@@ -33,6 +59,12 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.center = self.pos
         self.direction = 1
         self.search = True
+        self.pathStrategy = pathStrategy
+        self.planner = None # DStarLite kept between replans for INCREMENTAL
+        self.scheduler = scheduler
+        self.pathPending = False
+        self.backgroundPlanner = backgroundPlanner
+        self.pathFuture = None
 
         # Enemy characteristics
         self.health = o.EnemyHealthBar(self.rect.left, self.rect.top, 60, 10, 100)
@@ -41,20 +73,16 @@ class Enemy(pygame.sprite.Sprite):
         self.last_attack = pygame.time.get_ticks()
         self.last_attack_cooldown = 1000
         self.speed = c.ENEMY_SPEED
+        self.walls = walls
 
-    def get_path(self, route):
+    def get_path(self, route, map):
         """Given a route represented by nodes convert it into a path
             represented by coordinates.
             
             route: list of nodeID representing tiles on the map
+            map: Map object the route was planned on
         """
-        path = []
-        for node in route:
-            row = node // c.MAP_WIDTH
-            col = node - row * c.MAP_WIDTH
-            coord = pygame.Vector2(col * c.TILE_SIZE + c.TILE_SIZE / 2, row * c.TILE_SIZE + c.TILE_SIZE / 2)
-            path.append(coord)
-        return path
+        return [map.tile_center(node) for node in route]
 
     def update_path(self, player, map):
         """Given the player and map calculate shortest path to player.
@@ -62,31 +90,103 @@ class Enemy(pygame.sprite.Sprite):
             player: Player object.
             map: Map object
         """
-        tile_y = int(self.pos.y // c.TILE_SIZE)
-        tile_x = int(self.pos.x // c.TILE_SIZE)
-        my_node = tile_y * c.MAP_WIDTH + tile_x
-     
-        target_node = int(player.pos.y // c.TILE_SIZE) * c.MAP_WIDTH + int(player.pos.x // c.TILE_SIZE)
-        _, prev = map.graph.dijkstra(my_node, target_node)
-
-        route = []
-        node = target_node
-        while node:
-            route.append(node)
-            node = prev[node]
-        self.path = self.get_path(route)
+        my_node = map.tile_at(self.pos)
+        target_node = map.tile_at(player.pos)
+        if self.backgroundPlanner is not None and self.pathStrategy == Enemy.PathStrategy.SEARCH:
+            # keep following the old path until the future is done
+            if self.pathFuture is None:
+                self.pathFuture = self.backgroundPlanner.submit(my_node, target_node)
+            if not self.path:
+                self.path = [pygame.Vector2(self.pos)]
+            self.search = False
+            return
+        if self.scheduler is not None and self.pathStrategy == Enemy.PathStrategy.SEARCH:
+            # keep following the old path until the scheduler calls back
+            if not self.pathPending:
+                self.pathPending = True
+                self.scheduler.request(
+                    my_node,
+                    target_node,
+                    lambda route: self.on_path_found(route, map)
+                )
+            if not self.path:
+                self.path = [pygame.Vector2(self.pos)]
+            self.search = False
+            return
+        if self.pathStrategy == Enemy.PathStrategy.FLOW_FIELD:
+            route = map.flow_route(my_node, target_node, self.move_lag)
+        elif self.pathStrategy == Enemy.PathStrategy.HIERARCHICAL:
+            route = map.find_room_path(my_node, target_node)
+        elif self.pathStrategy == Enemy.PathStrategy.JUMP_POINT:
+            route = map.find_jump_path(my_node, target_node)
+        elif self.pathStrategy == Enemy.PathStrategy.INCREMENTAL:
+            if self.planner is None or self.planner.graph is not map.navGrid:
+                self.planner = DStarLite(map.navGrid)
+            route = self.planner.plan(my_node, target_node)
+        else:
+            route = map.find_path(my_node, target_node)
+        self.set_route(route, map)
         self.search = False
 
-    def update(self, player, bullets, map):
+    def on_path_found(self, route, map):
+        """Switch to a route served by the path scheduler or background planner.
+
+        The route starts where the enemy was when it asked for it, so the
+        tiles it walked since are cut off. If the enemy is no longer on the
+        route it is thrown away and a new one is asked for.
+
+            route: list of nodeID from the enemy to the player
+            map: Map object the route was planned on
+        """
+        self.pathPending = False
+        if route:
+            my_node = map.tile_at(self.pos)
+            if my_node not in route:
+                self.search = True
+                return
+            route = route[route.index(my_node):]
+        self.set_route(route, map)
+        self.move_idx = 1
+
+    def poll_path(self, map):
+        """Pick up the route of a finished background search.
+
+        Replans straight away if the route was planned before a door changed.
+
+            map: Map object the route was planned on
+        """
+        route = self.backgroundPlanner.result(self.pathFuture)
+        self.pathFuture = None
+        if route is None:
+            self.search = True
+        else:
+            self.on_path_found(route, map)
+
+    def set_route(self, route, map):
+        """Follow a route of nodeIDs, or stand still if it is empty.
+
+        Only the tiles walked before the next replan are kept, and those
+        are cut down to the tiles where the route turns.
+        """
+        if route:
+            waypoints = map.smooth_route(route[:self.move_lag])
+            # path is followed from the back
+            self.path = self.get_path(reversed(waypoints), map)
+        else:
+            self.path = [pygame.Vector2(self.pos)]
+
+    def update(self, player, broadPhase, map):
         """Update function to run each game tick.
         
-        Enemy should move towards player using djikstra's.
+        Enemy should move towards player along its planned path.
 
-            walls: list of pygame.Rects representing walls in the map.
+            player: Player object.
+            broadPhase: BroadPhase of the level, with "player" and "bullets" layers.
+            map: Map object.
         """
 
         # in range of player to attack and take melee attacks
-        if pygame.Rect.colliderect(player.rect, self.rect.inflate(4, 4)):
+        if broadPhase.query(self.rect.inflate(4, 4), "player"):
             self.action = "headbutt"
             if player.action == "punch" and pygame.time.get_ticks() - self.last_melee_hit > self.melee_lose_cooldown:
                 self.last_melee_hit = pygame.time.get_ticks()
@@ -97,6 +197,8 @@ class Enemy(pygame.sprite.Sprite):
         else:
             self.action = "walk"
         
+        if self.pathFuture is not None and self.pathFuture.done():
+            self.poll_path(map)
         if self.search:
             self.update_path(player, map)
         
@@ -110,7 +212,7 @@ class Enemy(pygame.sprite.Sprite):
 
         
         # receive hits from bullets
-        hit_bullet = pygame.sprite.spritecollideany(self, bullets)
+        hit_bullet = next(iter(broadPhase.query(self.rect, "bullets")), None)
         if hit_bullet:
             hit_bullet.kill()
             self.health.lose(hit_bullet.damage)
@@ -132,16 +234,17 @@ class Enemy(pygame.sprite.Sprite):
             if(self.current_frame >= self.spritesheet.num_frames(self.action)):
                 self.current_frame = 0
             
-            self.image = pygame.transform.flip(
-                self.spritesheet.get_image(self.action, self.current_frame), 
-                self.face_right,
-                False
+            self.image = self.spritesheet.get_image(
+                self.action,
+                self.current_frame,
+                flipped=self.face_right
             )
 
     def move(self, target):
         """Move enemy to the target point.
 
-        Returns true if target was reached.
+        Returns true if target was reached, or if a wall blocks the way
+        so the enemy moves on to its next target.
         
             target: Vector2.
         """
@@ -157,11 +260,18 @@ class Enemy(pygame.sprite.Sprite):
             self.face_right = True
 
         if distance >= self.speed:
-            self.pos += movement.normalize() * self.speed
+            step = movement.normalize() * self.speed
         else:
-            if distance != 0:
-                self.pos += movement.normalize() * distance
+            step = pygame.Vector2(movement)
             reached = True
+        if self.walls is not None and step:
+            box = pygame.FRect((0, 0), self.rect.size)
+            box.center = self.pos
+            moved = slide_move(box, step, self.walls)
+            if moved != step:
+                reached = True
+            step = moved
+        self.pos += step
         self.rect.center = self.pos
             
         self.health.update(self.rect.left - 10, self.rect.top - 15)
@@ -86,10 +86,12 @@ class Door(pygame.sprite.Sprite):
         """
         super().__init__()
         self.rect = rect
+        self.ogRect = pygame.Rect(rect)
         self.scaled_rect = rect.inflate(50, 50)
         self.open_button = pygame.K_m
         self.toggle = True
         self.present_button = False
+        self.playerNear = False
         self.canOpen = True
         self.keyPromptUi = KeyPromptUi(self.open_button, "Keys/M-Key.png", c.SM_KEY_SHEET_METADATA)
         self.keyPromptUi.rect.bottom = self.rect.top - 10
@@ -98,9 +100,21 @@ class Door(pygame.sprite.Sprite):
         # Event Subscribers
         EventManager.subscribe(EcodeEvent.CLOSE_DOORS, self.on_boss_attack)
         EventManager.subscribe(EcodeEvent.KILL_BOSS, self.on_boss_death)
+        EventManager.emit(EcodeEvent.DOOR_TOGGLED, rect=self.ogRect, toggle=self.toggle)
+
+    def set_toggle(self, toggle):
+        """Close (True) or open (False) the door.
+
+        Emits DOOR_TOGGLED when the state changes so the map can update
+        where sprites are able to walk.
+        """
+        if toggle == self.toggle:
+            return
+        self.toggle = toggle
+        EventManager.emit(EcodeEvent.DOOR_TOGGLED, rect=self.ogRect, toggle=toggle)
 
     def on_boss_attack(self):
-        self.toggle = True
+        self.set_toggle(True)
         self.canOpen = False
     
     def on_boss_death(self):
@@ -112,7 +126,7 @@ class Door(pygame.sprite.Sprite):
         Default is to turn self.toggle to False.
         """
         if self.canOpen:
-            self.toggle = False
+            self.set_toggle(False)
 
     def draw_door(self, surface, offset):
         """Logic to draw the door image.
@@ -128,6 +142,22 @@ class Door(pygame.sprite.Sprite):
             if self.present_button and event.key == self.open_button and self.canOpen:
                 self.door_action()
     
+    def add_triggers(self, triggers):
+        """Add the zone the player can open the door from."""
+        triggers.add(
+            self.scaled_rect,
+            onEnter=self.on_player_entered,
+            onExit=self.on_player_left,
+            owner=self
+        )
+
+    def on_player_entered(self):
+        self.playerNear = True
+
+    def on_player_left(self):
+        self.playerNear = False
+        self.present_button = False
+
     def update(self, player):
         """Updates the door based on player position.
 
@@ -136,11 +166,7 @@ class Door(pygame.sprite.Sprite):
             
             player: Player object.
         """
-        if self.scaled_rect.colliderect(player.rect) and self.toggle:
-            self.present_button = True
-        else:
-            self.present_button = False
-        
+        self.present_button = self.playerNear and self.toggle
         if self.present_button:
             self.keyPromptUi.update()
     
@@ -163,7 +189,6 @@ class LaserDoor(Door):
         """
         super().__init__(rect)
         
-        self.ogRect = pygame.Rect(rect)
         self.receding = False
         self.last_recede = pygame.time.get_ticks()
         self.recede_cooldown = 200
@@ -258,13 +283,14 @@ class LaserDoor(Door):
                 self.last_recede = pygame.time.get_ticks()
             else:
                 self.receding = False
-                self.toggle = False
+                self.set_toggle(False)
+
+    def on_player_left(self):
+        super().on_player_left()
+        self.speech_bubble.toggle = False
 
     def update(self, player):
         super().update(player)
-        if not self.scaled_rect.colliderect(player.rect):
-            self.speech_bubble.toggle = False
-        
         if self.receding:
             self.update_receding_animation()
     
@@ -381,16 +407,24 @@ class DanceFloor(StaticItem):
         self.on_dance_floor = False
         self.disco_timer = pygame.time.get_ticks()
 
-    def update(self, player):
-        if self.rect.colliderect(player.rect):
-            if not self.on_dance_floor:
-                pygame.event.post(pygame.event.Event(c.ENTERED_DANCE_FLOOR))
-            self.on_dance_floor = True
-        else:
-            if self.on_dance_floor:
-                pygame.event.post(pygame.event.Event(c.LEFT_DANCE_FLOOR))
-            self.on_dance_floor = False
+    def add_triggers(self, triggers):
+        """Add the dance floor itself as a zone."""
+        triggers.add(
+            self.rect,
+            onEnter=self.on_player_entered,
+            onExit=self.on_player_left,
+            owner=self
+        )
+
+    def on_player_entered(self):
+        self.on_dance_floor = True
+        pygame.event.post(pygame.event.Event(c.ENTERED_DANCE_FLOOR))
 
+    def on_player_left(self):
+        self.on_dance_floor = False
+        pygame.event.post(pygame.event.Event(c.LEFT_DANCE_FLOOR))
+
+    def update(self, player):
         if self.on_dance_floor:
             if pygame.time.get_ticks() - self.disco_timer > 1000:  # Change every second
                 self.disco_timer = pygame.time.get_ticks()
@@ -1,5 +1,8 @@
 import pygame
-from src.core.spritesheet import SpriteSheet
+from src.core.assetManager import AssetManager
+from src.core.spatialHash import SpatialHash
+from src.core.collisionMask import CollisionMask
+from src.core.movement import slide_move
 from src.core.ecodeEvents import EventManager, EcodeEvent
 import src.config as config
 import src.constants as c
@@ -21,7 +24,7 @@ class Player(pygame.sprite.Sprite):
         self.stamina = o.StaminaBar(pos[0], pos[1], 20, 5, 3)
         self.speed = 4
         self.pos = pygame.Vector2(pos)
-        self.spritesheet = SpriteSheet(filename, c.PLAYER_SHEET_METADATA)
+        self.spritesheet = AssetManager.get_spritesheet(filename, c.PLAYER_SHEET_METADATA)
 
         # Animation variables
         self.last_update = pygame.time.get_ticks()
@@ -36,6 +39,7 @@ class Player(pygame.sprite.Sprite):
         self.dash = False
 
         self.image = self.spritesheet.get_image(self.action, self.current_frame)
+        self.flippedImage = self.spritesheet.get_image(self.action, self.current_frame, flipped=True)
         self.rect = self.image.get_rect()
         self.rect.center = pos
         self.stats = stats
@@ -53,8 +57,12 @@ class Player(pygame.sprite.Sprite):
     def on_save_phrase(self, phrase: str):
         self.phrases.add(phrase)
     
-    def update(self, walls: list[pygame.Rect], doors: pygame.sprite.Group):
-        """Updates the player's position."""
+    def update(self, walls: CollisionMask | SpatialHash, doors: pygame.sprite.Group):
+        """Updates the player's position.
+
+            walls: SpatialHash or CollisionMask of the wall rects of the level
+            doors: group of doors the player can be blocked by
+        """
         new_pos = pygame.Vector2(self.pos)
         moved = False
 
@@ -97,19 +105,12 @@ class Player(pygame.sprite.Sprite):
             self.stamina.stamina -= 1
 
         
-        # tentatively update to the new position
-        # might have to undo if it turns out new position
-        # collides with a barrier
-        self.rect.center = new_pos
+        # sweep towards the new position, sliding along any wall in the way
+        box = pygame.FRect((0, 0), self.rect.size)
+        box.center = self.pos
         old_pos = self.pos
-        self.pos = new_pos
-
-        # check if the proposed position collides with walls
-        for wall in walls:
-            if pygame.Rect.colliderect(wall, self.rect):
-                # dont update the position
-                self.rect.center = old_pos
-                self.pos = old_pos
+        self.pos = self.pos + slide_move(box, new_pos - self.pos, walls)
+        self.rect.center = self.pos
         
         # check if the proposed position collides with closed doors
         door = pygame.sprite.spritecollideany(self, doors)
@@ -139,6 +140,7 @@ class Player(pygame.sprite.Sprite):
             if(self.current_frame >= self.spritesheet.num_frames(self.action)):
                 self.current_frame = 0
             self.image = self.spritesheet.get_image(self.action, self.current_frame)
+            self.flippedImage = self.spritesheet.get_image(self.action, self.current_frame, flipped=True)
         
         if self.action == "run" and self.current_frame != self.lastFootStepFrame:
             # if self.current_frame == 2:
@@ -154,6 +156,6 @@ class Player(pygame.sprite.Sprite):
         self.health.draw(surface, offset)
         self.stamina.draw(surface, offset)
         surface.blit(
-            pygame.transform.flip(self.image, self.face_left, False),
+            self.flippedImage if self.face_left else self.image,
             self.rect.topleft + offset
         )
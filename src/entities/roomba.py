@@ -1,10 +1,10 @@
 import pygame
-import src.core.utils as utils
 from src.core.ecodeEvents import EcodeEvent, EventManager
 import src.constants as c
 import src.entities.objects as o
 from src.components.ui import KeyPromptUi
 from src.core.spritesheet import SpriteSheet
+from src.core.assetManager import AssetManager
 from enum import Enum
 
 
@@ -33,7 +33,7 @@ class Roomba(pygame.sprite.Sprite):
         self.cooldown = 100
         
         # Image variables
-        og_image, _ = utils.load_png(image)
+        og_image = AssetManager.get_image(image)
         self.image = pygame.transform.scale(og_image, (72, 72))
         self.rect = self.image.get_rect()
         self.face_right = True
@@ -54,11 +54,28 @@ class Roomba(pygame.sprite.Sprite):
 
         self.keyPromptUi = KeyPromptUi(pygame.K_t, "Keys/T-Key.png")
         self.dialog = None
+        self.playerNear = False
 
     def set_dialog(self, dialog: list[str]):
         self.dialog = dialog
         self.dialogIdx = 0
 
+    def add_triggers(self, triggers):
+        """Add a zone that follows the roomba around."""
+        triggers.add(
+            self.rect,
+            onEnter=self.on_player_entered,
+            onExit=self.on_player_left,
+            owner=self,
+            moving=True
+        )
+
+    def on_player_entered(self):
+        self.playerNear = True
+
+    def on_player_left(self):
+        self.playerNear = False
+
     def update(self, player):
         """Update function to run each game tick.
         
@@ -68,7 +85,7 @@ class Roomba(pygame.sprite.Sprite):
             player: the player object.
         """
         if self.move_state == Roomba.MoveState.STOP:
-            if pygame.Rect.colliderect(self.rect, player.rect):
+            if self.playerNear:
                 self.move_state = Roomba.MoveState.PATH
         elif self.move_state == Roomba.MoveState.PATH:
             if self.move(self.target):
@@ -77,10 +94,10 @@ class Roomba(pygame.sprite.Sprite):
                 else:
                     self.target_point += 1
                     self.target = self.path[self.target_point]
-            if pygame.Rect.colliderect(self.rect, player.rect):
+            if self.playerNear:
                 self.move_state = Roomba.MoveState.PAUSE
         elif self.move_state == Roomba.MoveState.PAUSE:
-            if not pygame.Rect.colliderect(self.rect, player.rect):
+            if not self.playerNear:
                 self.move_state = Roomba.MoveState.PATH
         
         self.keyPromptUi.rect.bottom = self.rect.top
@@ -12,21 +12,39 @@ def main(screen):
     pygame.display.set_caption("EscapeCodes")
     clock = pygame.time.Clock()
     manager = GameManager()
+    idle = False
     
     while True:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if idle and not events:
+            # Nothing on screen is changing, so sleep until there is input
+            event = pygame.event.wait(c.IDLE_WAIT_MS)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+        for event in events:
             if event.type == pygame.QUIT:
                 return
             manager.handle_event(event)
-        
-        # fill the screen with a color to wipe away anything from last frame
-        screen.fill("black")
 
         manager.update()
-        manager.draw(screen)
 
-        # flip() the display to put work on screen
-        pygame.display.flip()
+        dirtyRects = manager.dirty_rects()
+        if dirtyRects is None:
+            # fill the screen with a color to wipe away anything from last frame
+            screen.fill("black")
+            manager.draw(screen)
+
+            # flip() the display to put work on screen
+            pygame.display.flip()
+        elif dirtyRects:
+            # Only redraw and put on screen the parts that changed
+            for rect in dirtyRects:
+                screen.set_clip(rect)
+                screen.fill("black")
+                manager.draw(screen)
+            screen.set_clip(None)
+            pygame.display.update(dirtyRects)
+        idle = dirtyRects == []
 
         clock.tick(60)  # limits FPS to 60
 
@@ -1,2 +1,7 @@
 from .playerTest import *
-from .problemTest import *
\ No newline at end of file
+from .problemTest import *
+from .pathfindingTest import *
+from .collisionTest import *
+from .renderingTest import *
+from .menuTest import *
+from .enemyTest import *
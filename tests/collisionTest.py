@@ -0,0 +1,244 @@
+"""Unit tests for wall collision queries."""
+
+import unittest
+import random
+import pygame
+import src.core.utils as utils
+from src.core.spatialHash import SpatialHash
+from src.core.collisionMask import CollisionMask
+from src.core.broadPhase import BroadPhase
+from src.core.movement import slide_move
+from src.core.triggers import TriggerIndex
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Test overlap queries against the wall index."""
+
+    def setUp(self):
+        self.walls = [
+            pygame.Rect(0, 0, 64, 64),
+            pygame.Rect(100, 0, 200, 20),
+            pygame.Rect(500, 500, 10, 10),
+        ]
+        self.index = SpatialHash(self.walls, cellSize=64)
+
+    def test_collide(self):
+        self.assertEqual(self.index.collide(pygame.Rect(250, 10, 5, 5)), self.walls[1])
+        self.assertIsNone(self.index.collide(pygame.Rect(64, 0, 36, 64)))
+        self.assertIsNone(self.index.collide(pygame.Rect(-50, -50, 10, 10)))
+
+    def test_query_has_no_duplicates(self):
+        candidates = self.index.query(pygame.Rect(90, 0, 300, 64))
+        self.assertEqual(candidates.count(self.walls[1]), 1)
+
+    def test_matches_linear_scan(self):
+        for x in range(-64, 600, 37):
+            for y in range(-64, 600, 41):
+                rect = pygame.Rect(x, y, 40, 30)
+                expected = [wall for wall in self.walls if wall.colliderect(rect)]
+                self.assertEqual(self.index.collide_all(rect), expected)
+
+
+class TestMergeRects(unittest.TestCase):
+    """Test merging wall rects at level load."""
+
+    def covered(self, rects, size=200):
+        """Set of pixels covered by rects."""
+        return {
+            (x, y) for rect in rects
+            for x in range(max(0, rect.left), min(size, rect.right))
+            for y in range(max(0, rect.top), min(size, rect.bottom))
+        }
+
+    def test_merges_tiles_of_a_strip(self):
+        tiles = [pygame.Rect(x, 0, 10, 10) for x in range(0, 100, 10)]
+        self.assertEqual(utils.merge_rects(tiles), [pygame.Rect(0, 0, 100, 10)])
+
+    def test_l_shape(self):
+        tiles = [pygame.Rect(x, y, 10, 10) for x, y in [(0, 0), (10, 0), (20, 0), (0, 10), (0, 20)]]
+        self.assertEqual(len(utils.merge_rects(tiles)), 2)
+
+    def test_same_area_without_overlaps(self):
+        rng = random.Random(0)
+        rects = [
+            pygame.Rect(x, y, 10, 10)
+            for x in range(0, 200, 10) for y in range(0, 200, 10)
+            if rng.random() < 0.6
+        ]
+        rects += [
+            pygame.Rect(rng.randrange(150), rng.randrange(150), rng.randrange(1, 50), rng.randrange(1, 50))
+            for _ in range(10)
+        ]
+        merged = utils.merge_rects(rects)
+        self.assertLess(len(merged), len(rects))
+        self.assertEqual(self.covered(merged), self.covered(rects))
+        self.assertEqual(sum(rect.width * rect.height for rect in merged), len(self.covered(merged)))
+
+
+class TestCollisionMask(unittest.TestCase):
+    """Test overlap queries against the wall bitmask."""
+
+    def setUp(self):
+        self.walls = [
+            pygame.Rect(0, 0, 64, 64),
+            pygame.Rect(100, 0, 200, 20),
+            pygame.Rect(500, 500, 10, 10),
+        ]
+        self.mask = CollisionMask((600, 600), self.walls)
+
+    def test_collide_point(self):
+        self.assertTrue(self.mask.collide_point((63, 63)))
+        self.assertFalse(self.mask.collide_point((64, 63)))
+        self.assertFalse(self.mask.collide_point((-1, 5)))
+
+    def test_matches_spatial_hash(self):
+        index = SpatialHash(self.walls)
+        for x in range(-64, 600, 37):
+            for y in range(-64, 600, 41):
+                rect = pygame.Rect(x, y, 40, 30)
+                self.assertEqual(self.mask.collide(rect), index.collide(rect) is not None)
+
+    def test_collide_mask(self):
+        # The wall fits inside the hole of the ring, though their rects overlap
+        surface = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 255), (15, 15), 15, width=2)
+        ring = pygame.mask.from_surface(surface)
+        self.assertFalse(self.mask.collide_mask(ring, (490, 490)))
+        self.assertTrue(self.mask.collide_mask(ring, (480, 490)))
+
+    def test_query_skips_index_in_open_space(self):
+        self.assertEqual(self.mask.query(pygame.Rect(200, 200, 40, 30)), [])
+        self.assertEqual(self.mask.query(pygame.Rect(250, 10, 5, 5)), [self.walls[1]])
+
+    def test_slide_move_matches_spatial_hash(self):
+        index = SpatialHash(self.walls)
+        for x in range(-64, 600, 37):
+            for y in range(-64, 600, 41):
+                box = pygame.FRect(x, y, 40, 30)
+                for movement in [(60, 0), (-45, 20), (0, -70), (12.5, 33)]:
+                    self.assertEqual(
+                        slide_move(box, pygame.Vector2(movement), self.mask),
+                        slide_move(box, pygame.Vector2(movement), index)
+                    )
+
+
+class TestBroadPhase(unittest.TestCase):
+    """Test overlap queries between groups of moving sprites."""
+
+    def make_group(self, rects):
+        group = pygame.sprite.Group()
+        for rect in rects:
+            sprite = pygame.sprite.Sprite()
+            sprite.rect = pygame.Rect(rect)
+            group.add(sprite)
+        return group
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.enemies = self.make_group(
+            (rng.randrange(1000), rng.randrange(1000), 64, 64) for _ in range(60)
+        )
+        self.bullets = self.make_group(
+            (rng.randrange(1000), rng.randrange(1000), 8, 8) for _ in range(60)
+        )
+        self.phase = BroadPhase(cellSize=128, margin=16)
+        self.phase.add("enemies", self.enemies)
+        self.phase.add("bullets", self.bullets)
+        self.phase.update()
+
+    def test_query_matches_every_pair(self):
+        expected = {
+            (enemy, bullet) for enemy in self.enemies for bullet in self.bullets
+            if enemy.rect.colliderect(bullet.rect)
+        }
+        self.assertGreater(len(expected), 0)
+        found = {
+            (enemy, bullet) for enemy in self.enemies
+            for bullet in self.phase.query(enemy.rect, "bullets")
+        }
+        self.assertEqual(found, expected)
+
+    def test_finds_sprites_moved_within_margin(self):
+        bullet = next(iter(self.bullets))
+        bullet.rect.move_ip(15, -15)
+        self.assertIn(bullet, self.phase.query(bullet.rect, "bullets"))
+        self.assertIn(bullet, self.phase.near(bullet, "bullets"))
+
+    def test_killed_sprites_dropped_on_update(self):
+        bullet = next(iter(self.bullets))
+        bullet.kill()
+        self.phase.update()
+        self.assertNotIn(bullet, self.phase.query(bullet.rect, "bullets"))
+
+
+class TestSlideMove(unittest.TestCase):
+    """Test swept movement against the wall index."""
+
+    def setUp(self):
+        self.walls = SpatialHash([
+            pygame.Rect(100, 0, 2, 400),
+            pygame.Rect(0, 200, 100, 10),
+        ])
+        self.box = pygame.FRect(20, 20, 40, 40)
+
+    def test_no_tunnelling(self):
+        moved = slide_move(self.box, pygame.Vector2(500, 0), self.walls)
+        self.assertEqual(moved, pygame.Vector2(40, 0))
+
+    def test_slides_along_wall(self):
+        moved = slide_move(self.box, pygame.Vector2(60, 30), self.walls)
+        self.assertEqual(moved, pygame.Vector2(40, 30))
+        moved = slide_move(self.box, pygame.Vector2(-5, 300), self.walls)
+        self.assertEqual(moved, pygame.Vector2(-5, 140))
+
+    def test_free_move(self):
+        moved = slide_move(self.box, pygame.Vector2(10.5, -7.25), self.walls)
+        self.assertEqual(moved, pygame.Vector2(10.5, -7.25))
+
+    def test_leaves_overlapping_wall(self):
+        box = pygame.FRect(90, 100, 20, 20)
+        self.assertEqual(slide_move(box, pygame.Vector2(-30, 0), self.walls), pygame.Vector2(-30, 0))
+
+
+class TestTriggerIndex(unittest.TestCase):
+    """Test entering and leaving interaction zones."""
+
+    def setUp(self):
+        self.events = []
+        self.triggers = TriggerIndex(cellSize=64)
+        self.zone = self.triggers.add(
+            pygame.Rect(100, 100, 100, 100),
+            onEnter=lambda: self.events.append("enter"),
+            onExit=lambda: self.events.append("exit"),
+            owner="zone"
+        )
+
+    def test_enter_and_exit_fire_once(self):
+        player = pygame.Rect(0, 0, 20, 20)
+        for pos in [(0, 0), (90, 90), (120, 120), (150, 150), (300, 300), (300, 300)]:
+            player.topleft = pos
+            self.triggers.update(player)
+        self.assertEqual(self.events, ["enter", "exit"])
+        self.assertFalse(self.zone.inside)
+
+    def test_near(self):
+        self.triggers.update(pygame.Rect(150, 150, 20, 20))
+        self.assertEqual(self.triggers.near(["zone"]), ["zone"])
+        self.assertEqual(self.triggers.near([]), [])
+
+    def test_moving_zone_follows_its_rect(self):
+        rect = pygame.Rect(500, 500, 10, 10)
+        zone = self.triggers.add(rect, moving=True)
+        player = pygame.Rect(0, 0, 20, 20)
+        self.triggers.update(player)
+        self.assertFalse(zone.inside)
+        rect.topleft = (5, 5)
+        self.triggers.update(player)
+        self.assertTrue(zone.inside)
+
+    def test_contain(self):
+        zone = self.triggers.add(pygame.Rect(300, 0, 100, 100), contain=True)
+        self.triggers.update(pygame.Rect(290, 10, 20, 20))
+        self.assertFalse(zone.inside)
+        self.triggers.update(pygame.Rect(310, 10, 20, 20))
+        self.assertTrue(zone.inside)
@@ -0,0 +1,43 @@
+"""Unit tests for the Enemy class."""
+
+import unittest
+import pygame
+from src.core.map import Map
+from src.entities.enemy import Enemy
+
+
+class TestLateRoute(unittest.TestCase):
+    """Test picking up a route that was planned a few frames ago."""
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.map = Map("level0.png", "level0.tmj")
+        start = self.map.tile_at(self.map.playerSpawn)
+        self.route = next(
+            route for route in (
+                self.map.find_path(start, tile)
+                for tile in reversed(range(self.map.width * self.map.height))
+            )
+            if len(route) > 5
+        )
+        self.enemy = Enemy("robot.png", self.map.tile_center(self.route[0]), Enemy.PathStrategy.SEARCH)
+        self.enemy.search = False
+
+    def test_walked_tiles_cut_off(self):
+        self.enemy.pos = self.map.tile_center(self.route[3])
+        self.enemy.on_path_found(self.route, self.map)
+        # path is followed from the back
+        self.assertEqual(self.enemy.path[-1], self.map.tile_center(self.route[3]))
+        self.assertFalse(self.enemy.search)
+
+    def test_left_route_replans(self):
+        self.enemy.path = [pygame.Vector2(1, 2)]
+        offRoute = next(
+            tile for tile in range(self.map.width * self.map.height)
+            if self.map.navGrid.is_walkable(tile) and tile not in self.route
+        )
+        self.enemy.pos = self.map.tile_center(offRoute)
+        self.enemy.on_path_found(self.route, self.map)
+        self.assertEqual(self.enemy.path, [pygame.Vector2(1, 2)])
+        self.assertTrue(self.enemy.search)
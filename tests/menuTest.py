@@ -0,0 +1,71 @@
+"""Unit tests for redrawing only the parts of a menu that changed."""
+
+import unittest
+import pygame
+from src.components.menu import Menu
+from src.components.button import Button, TextInput
+
+
+class TestMenuDirtyRects(unittest.TestCase):
+    """Test which parts of a menu are redrawn each frame."""
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.menu = Menu(None)
+
+    def test_first_frame_redraws_everything(self):
+        self.assertIsNone(self.menu.dirty_rects())
+        self.assertEqual(self.menu.dirty_rects(), [])
+
+    def test_mark_dirty_rects(self):
+        self.menu.dirty_rects()
+        self.menu.mark_dirty((0, 0, 10, 10))
+        self.menu.mark_dirty(pygame.Rect(20, 20, 5, 5))
+        self.assertEqual(
+            self.menu.dirty_rects(),
+            [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 20, 5, 5)]
+        )
+        self.assertEqual(self.menu.dirty_rects(), [])
+
+    def test_mark_dirty_everything(self):
+        self.menu.dirty_rects()
+        self.menu.mark_dirty((0, 0, 10, 10))
+        self.menu.mark_dirty()
+        self.assertIsNone(self.menu.dirty_rects())
+        self.assertEqual(self.menu.dirty_rects(), [])
+
+    def test_redraw_events(self):
+        self.menu.dirty_rects()
+        self.menu.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)))
+        self.assertEqual(self.menu.dirty_rects(), [])
+        self.menu.handle_event(pygame.event.Event(pygame.WINDOWEXPOSED))
+        self.assertIsNone(self.menu.dirty_rects())
+
+
+class TestControlRedraw(unittest.TestCase):
+    """Test that controls report when they need to be redrawn."""
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def test_button_change_color(self):
+        button = Button(None, (100, 100), "Play")
+        inside = button.image_rect.center
+        outside = (0, 0)
+        self.assertFalse(button.change_color(outside))
+        self.assertTrue(button.change_color(inside))
+        self.assertFalse(button.change_color(inside))
+        self.assertTrue(button.update(outside))
+        self.assertFalse(button.update(outside))
+
+    def test_text_input_update(self):
+        textInput = TextInput((100, 100), 80, 30)
+        inside = textInput.rect.center
+        outside = (0, 0)
+        self.assertFalse(textInput.update(outside))
+        self.assertTrue(textInput.update(inside))
+        self.assertFalse(textInput.update(inside))
+        self.assertTrue(textInput.update(outside))
+        self.assertEqual(textInput.bounding_rect(), textInput.rect)
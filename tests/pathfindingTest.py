@@ -0,0 +1,486 @@
+"""Unit tests for pathfinding over the navigation grid."""
+
+import unittest
+import threading
+import pygame
+from src.core.navGrid import NavGrid
+from src.core.pathfinding import FlowField
+from src.core.roomGraph import RoomGraph
+from src.core.dstarLite import DStarLite
+from src.core.jumpPointSearch import JumpPointSearch
+from src.core.pathScheduler import PathScheduler
+from src.core.threadedPlanner import ThreadedPlanner
+from src.core.routeCache import RouteCache
+from src.core.ecodeEvents import EventManager, EcodeEvent
+
+
+def build_graph(rows):
+    """Build a NavGrid from rows of text where '.' is walkable and '#' is not."""
+    return NavGrid([[tile == "." for tile in row] for row in rows])
+
+
+def route_cost(graph, route):
+    """Sum the edge weights along a route."""
+    return sum(dict(graph.neighbors(a))[b] for a, b in zip(route, route[1:]))
+
+
+class TestNavGrid(unittest.TestCase):
+    """Test neighbour lookup on the navigation grid."""
+
+    def setUp(self):
+        self.grid = build_graph([
+            "..#",
+            "...",
+        ])
+
+    def test_neighbors_stay_on_map(self):
+        self.assertEqual(sorted(n for n, _ in self.grid.neighbors(5)), [1, 4])
+
+    def test_weights(self):
+        self.assertEqual(dict(self.grid.neighbors(0)), {1: 1, 3: 1, 4: 1.4})
+
+    def test_blocked_tiles(self):
+        self.assertFalse(self.grid.is_walkable(2))
+        self.assertFalse(self.grid.is_walkable(-1))
+        self.assertFalse(self.grid.is_walkable(6))
+        self.assertNotIn(2, dict(self.grid.neighbors(1)))
+
+    def test_set_walkable(self):
+        self.grid.set_walkable([2], True)
+        self.assertTrue(self.grid.is_walkable(2))
+        self.assertIn(2, dict(self.grid.neighbors(5)))
+        self.grid.set_walkable([4], False)
+        self.assertNotIn(4, dict(self.grid.neighbors(0)))
+        self.assertEqual(self.grid.changeLog, [[2], [4]])
+
+    def test_line_of_sight(self):
+        grid = build_graph([
+            "....",
+            ".#..",
+            "....",
+        ])
+        self.assertTrue(grid.line_of_sight(0.5, 0.5, 3.5, 0.5))
+        self.assertTrue(grid.line_of_sight(3.5, 0.5, 2.5, 2.5))
+        self.assertFalse(grid.line_of_sight(0.5, 0.5, 2.5, 2.5))
+        self.assertFalse(grid.line_of_sight(0.5, 1.5, 3.5, 1.5))
+        self.assertFalse(grid.line_of_sight(0.5, 0.5, 4.5, 0.5))
+
+    def test_smooth_route(self):
+        grid = build_graph([
+            "......",
+            "####..",
+            "......",
+        ])
+        route = grid.find_path(0, 12)
+        waypoints = grid.smooth_route(route)
+        self.assertEqual(waypoints[0], 0)
+        self.assertEqual(waypoints[-1], 12)
+        self.assertLess(len(waypoints), len(route))
+        self.assertEqual([tile for tile in route if tile in waypoints], waypoints)
+        self.assertEqual(grid.smooth_route(grid.find_path(12, 17)), [12, 17])
+
+
+class TestAStar(unittest.TestCase):
+    """Test the A* search behind NavGrid.find_path."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            ".....",
+            ".###.",
+            ".#...",
+            ".#.#.",
+            "...#.",
+        ])
+
+    def test_route_endpoints(self):
+        route = self.graph.find_path(0, 24)
+        self.assertEqual(route[0], 0)
+        self.assertEqual(route[-1], 24)
+
+    def test_route_is_connected(self):
+        route = self.graph.find_path(0, 12)
+        for a, b in zip(route, route[1:]):
+            self.assertIn(b, dict(self.graph.neighbors(a)))
+
+    def test_shortest_route(self):
+        # Three steps along the top row, two diagonals then one step left
+        route = self.graph.find_path(0, 12)
+        self.assertAlmostEqual(route_cost(self.graph, route), 6.8)
+
+    def test_same_tile(self):
+        self.assertEqual(self.graph.find_path(7, 7), [])
+        self.assertEqual(self.graph.find_path(12, 12), [12])
+
+    def test_unreachable(self):
+        graph = build_graph([
+            "..#..",
+            "..#..",
+        ])
+        self.assertEqual(graph.find_path(0, 4), [])
+
+    def test_repeated_queries(self):
+        first = self.graph.find_path(0, 24)
+        self.graph.find_path(20, 4)
+        self.assertEqual(self.graph.find_path(0, 24), first)
+
+
+class TestJumpPointSearch(unittest.TestCase):
+    """Test Jump Point Search against Dijkstra distances."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            "..........",
+            ".###..#...",
+            ".#....#.#.",
+            ".#.##...#.",
+            "...#..#...",
+        ])
+        self.search = JumpPointSearch(self.graph)
+
+    def test_routes_match_dijkstra_cost(self):
+        field = FlowField(self.graph)
+        tiles = self.graph.walkable_ids()
+        for dest in tiles:
+            field.set_goal(dest)
+            for src in tiles:
+                route = self.search.find_path(src, dest)
+                self.assertEqual(route[0], src)
+                self.assertEqual(route[-1], dest)
+                for a, b in zip(route, route[1:]):
+                    self.assertIn(b, dict(self.graph.neighbors(a)))
+                self.assertAlmostEqual(route_cost(self.graph, route), field.dist[src])
+
+    def test_open_room_expands_fewer_tiles(self):
+        graph = build_graph(["." * 20] * 20)
+        search = JumpPointSearch(graph)
+        route = search.find_path(0, 399)
+        self.assertEqual(len(route), 20)
+        self.assertLess(search.expanded, 5)
+        graph.find_path(0, 399)
+        self.assertLess(search.expanded, graph.pathfinder.expanded)
+
+    def test_unreachable(self):
+        graph = build_graph([
+            "..#..",
+            "..#..",
+        ])
+        self.assertEqual(JumpPointSearch(graph).find_path(0, 4), [])
+        self.assertEqual(self.search.find_path(11, 0), [])
+
+
+class TestPathScheduler(unittest.TestCase):
+    """Test serving path requests within a per-frame budget."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            "..........",
+            ".###..#...",
+            ".#....#.#.",
+            ".#.##...#.",
+            "...#..#...",
+        ])
+        self.scheduler = PathScheduler(self.graph, maxExpansions=5, maxTime=1000)
+        self.routes = []
+
+    def test_search_resumes_over_frames(self):
+        self.scheduler.request(0, 49, self.routes.append)
+        frames = 0
+        while not self.routes:
+            self.scheduler.update()
+            self.assertLessEqual(self.scheduler.expanded, 5)
+            frames += 1
+        self.assertGreater(frames, 1)
+        self.assertAlmostEqual(
+            route_cost(self.graph, self.routes[0]),
+            route_cost(self.graph, self.graph.find_path(0, 49))
+        )
+
+    def test_duplicate_requests_share_search(self):
+        self.scheduler.request(0, 49, self.routes.append)
+        self.scheduler.request(0, 49, self.routes.append)
+        self.assertEqual(self.scheduler.pending(), 1)
+        while self.scheduler.pending():
+            self.scheduler.update()
+        self.assertEqual(len(self.routes), 2)
+        self.assertIs(self.routes[0], self.routes[1])
+
+    def test_restarts_when_graph_changes(self):
+        self.scheduler.request(0, 9, self.routes.append)
+        self.scheduler.update()
+        self.graph.set_walkable([5], False)
+        while self.scheduler.pending():
+            self.scheduler.update()
+        self.assertNotIn(5, self.routes[0])
+        self.assertEqual(self.routes[0][-1], 9)
+
+
+class TestThreadedPlanner(unittest.TestCase):
+    """Test searching on a worker thread against grid snapshots."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            "..........",
+            ".###..#...",
+            ".#....#.#.",
+            ".#.##...#.",
+            "...#..#...",
+        ])
+        self.planner = ThreadedPlanner(self.graph)
+
+    def tearDown(self):
+        self.planner.shutdown()
+
+    def test_route_matches_astar(self):
+        future = self.planner.submit(0, 49)
+        future.result(timeout=5)
+        self.assertEqual(self.planner.result(future), self.graph.find_path(0, 49))
+
+    def test_stale_route_dropped(self):
+        future = self.planner.submit(0, 9)
+        future.result(timeout=5)
+        self.graph.set_walkable([5], False)
+        self.assertIsNone(self.planner.result(future))
+
+        future = self.planner.submit(0, 9)
+        future.result(timeout=5)
+        route = self.planner.result(future)
+        self.assertEqual(route[-1], 9)
+        self.assertNotIn(5, route)
+
+    def test_door_publishes_snapshot(self):
+        # Hold the worker so the search stays queued
+        gate = threading.Event()
+        self.planner.executor.submit(gate.wait, 5)
+        future = self.planner.submit(0, 9)
+        self.graph.set_walkable([5], False)
+        EventManager.emit(EcodeEvent.DOOR_TOGGLED, rect=pygame.Rect(0, 0, 1, 1), toggle=True)
+        gate.set()
+        self.assertTrue(future.cancelled())
+        self.assertIsNone(self.planner.result(future))
+        self.assertFalse(self.planner.snapshot.is_walkable(5))
+
+
+class TestRouteCache(unittest.TestCase):
+    """Test the LRU route cache and its door-aware invalidation."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            "..........",
+            "..........",
+            "..........",
+            "..........",
+        ])
+        self.cache = RouteCache(3, self.graph.width)
+        for src, dest in [(0, 39), (20, 24), (30, 39)]:
+            self.cache.put(src, dest, self.graph.find_path(src, dest))
+
+    def test_counters(self):
+        self.assertEqual(self.cache.get(20, 24), self.graph.find_path(20, 24))
+        self.assertIsNone(self.cache.get(1, 2))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertAlmostEqual(self.cache.hit_rate(), 0.5)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.get(0, 39)
+        self.cache.put(1, 2, [1, 2])
+        self.assertIsNone(self.cache.get(20, 24))
+        self.assertIsNotNone(self.cache.get(0, 39))
+
+    def test_closing_drops_routes_through_tiles(self):
+        self.cache.invalidate_blocked([22])
+        self.assertIsNone(self.cache.get(20, 24))
+        self.assertIsNotNone(self.cache.get(30, 39))
+
+    def test_opening_drops_routes_it_could_shorten(self):
+        self.cache.put(1, 7, [])
+        self.cache.invalidate_opened([4])
+        self.assertIsNone(self.cache.get(1, 7))
+        self.assertIsNotNone(self.cache.get(30, 39))
+
+
+class TestFlowField(unittest.TestCase):
+    """Test the shared flow field towards a goal tile."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            ".....",
+            ".###.",
+            ".#...",
+            ".#.#.",
+            "...#.",
+        ])
+        self.field = FlowField(self.graph)
+
+    def test_routes_match_astar_cost(self):
+        self.field.set_goal(12)
+        for tile in self.graph.walkable_ids():
+            route = self.field.route(tile, self.graph.size)
+            self.assertEqual(route[-1], 12)
+            self.assertAlmostEqual(
+                route_cost(self.graph, route),
+                route_cost(self.graph, self.graph.find_path(tile, 12))
+            )
+
+    def test_max_steps(self):
+        self.field.set_goal(24)
+        self.assertEqual(len(self.field.route(0, 2)), 3)
+
+    def test_only_recomputes_on_new_goal(self):
+        self.field.set_goal(12)
+        self.field.expanded = 0
+        self.field.set_goal(12)
+        self.assertEqual(self.field.expanded, 0)
+        self.field.set_goal(24)
+        self.assertGreater(self.field.expanded, 0)
+
+    def test_unreachable(self):
+        graph = build_graph([
+            "..#..",
+            "..#..",
+        ])
+        field = FlowField(graph)
+        field.set_goal(4)
+        self.assertEqual(field.route(0, 10), [])
+        self.assertEqual(field.next_step(0), -1)
+
+
+class TestRoomGraph(unittest.TestCase):
+    """Test hierarchical pathfinding through rooms and doors."""
+
+    def setUp(self):
+        # Two rooms joined by a corridor with a door in the middle
+        self.graph = build_graph([
+            "...#.....#...",
+            "...........#.",
+            "...#.....#...",
+        ])
+        width = 13
+        self.leftRoom = [row * width + col for row in range(3) for col in range(3)]
+        self.rightRoom = [row * width + col for row in range(3) for col in range(10, 13)]
+        self.door = [row * width + col for row in range(3) for col in range(6, 7)]
+        self.roomGraph = RoomGraph(self.graph, [self.leftRoom, self.rightRoom], [self.door])
+
+    def assert_valid_route(self, route, src, dest):
+        self.assertEqual(route[0], src)
+        self.assertEqual(route[-1], dest)
+        for a, b in zip(route, route[1:]):
+            self.assertIn(b, dict(self.graph.neighbors(a)))
+
+    def test_route_between_rooms(self):
+        route = self.roomGraph.find_path(0, 38)
+        self.assert_valid_route(route, 0, 38)
+
+    def test_route_inside_room(self):
+        route = self.roomGraph.find_path(0, 28)
+        self.assert_valid_route(route, 0, 28)
+        self.assertAlmostEqual(route_cost(self.graph, route), 2.8)
+
+    def test_closed_door(self):
+        self.graph.set_walkable(self.door, False)
+        self.roomGraph.set_door_open(self.door, False)
+        self.assertEqual(self.roomGraph.find_path(0, 38), [])
+        self.graph.set_walkable(self.door, True)
+        self.roomGraph.set_door_open(self.door, True)
+        self.assert_valid_route(self.roomGraph.find_path(0, 38), 0, 38)
+
+
+class TestRoomGraphRouteLength(unittest.TestCase):
+    """Test that room graph routes stay close to the shortest ones."""
+
+    def setUp(self):
+        # Three by three rooms joined by doorways wide enough for two portals
+        size = 12
+        rows = []
+        for row in range(size * 3 + 1):
+            line = ""
+            for col in range(size * 3 + 1):
+                outside = row in (0, size * 3) or col in (0, size * 3)
+                doorway = (
+                    row % size == 0 and 2 <= col % size <= 9
+                    or col % size == 0 and 3 <= row % size <= 10
+                )
+                onWall = row % size == 0 or col % size == 0
+                line += "#" if onWall and (outside or not doorway) else "."
+            rows.append(line)
+        self.graph = build_graph(rows)
+        width = len(rows[0])
+        rooms = [
+            [row * width + col for row in range(i + 1, i + size) for col in range(j + 1, j + size)]
+            for i in range(0, size * 3, size) for j in range(0, size * 3, size)
+        ]
+        self.roomGraph = RoomGraph(self.graph, rooms, [])
+        self.tiles = [tile for tile in range(self.graph.size) if self.graph.is_walkable(tile)]
+
+    def test_max_length_ratio(self):
+        worst = 0
+        for src in self.tiles[::31]:
+            for dest in self.tiles[::37]:
+                shortest = self.graph.find_path(src, dest)
+                if len(shortest) < 2:
+                    continue
+                route = self.roomGraph.find_path(src, dest)
+                worst = max(worst, route_cost(self.graph, route) / route_cost(self.graph, shortest))
+        self.assertLess(worst, 1.35)
+
+    def test_short_crossing_is_shortest(self):
+        # Either side of a doorway, far from the portals at its ends
+        src, dest = 11 * 37 + 5, 13 * 37 + 5
+        route = self.roomGraph.find_path(src, dest)
+        self.assertAlmostEqual(route_cost(self.graph, route), 2.0)
+
+
+class TestDStarLite(unittest.TestCase):
+    """Test incremental replanning with D* Lite."""
+
+    def setUp(self):
+        self.graph = build_graph([
+            "........",
+            ".####.#.",
+            ".#......",
+            ".#.##.#.",
+            "...#....",
+        ])
+        self.planner = DStarLite(self.graph)
+
+    def assert_optimal(self, start, goal):
+        route = self.planner.plan(start, goal)
+        expected = self.graph.find_path(start, goal)
+        self.assertEqual(route[0], start)
+        self.assertEqual(route[-1], goal)
+        self.assertAlmostEqual(route_cost(self.graph, route), route_cost(self.graph, expected))
+
+    def test_moving_start_and_goal(self):
+        for start, goal in [(0, 39), (8, 39), (16, 38), (16, 22), (24, 23), (33, 7)]:
+            self.assert_optimal(start, goal)
+
+    def test_idle_goal_reuses_search(self):
+        route = self.planner.plan(0, 39)
+        self.planner.plan(route[1], 39)
+        self.assertEqual(self.planner.expanded, 0)
+
+    def test_walkability_changes(self):
+        self.assert_optimal(0, 39)
+        self.graph.set_walkable([13, 21], False)
+        self.assert_optimal(0, 39)
+        self.graph.set_walkable([13, 21], True)
+        self.assert_optimal(8, 39)
+
+    def test_unreachable(self):
+        self.graph.set_walkable([1, 9, 17, 25, 33], False)
+        self.assertEqual(self.planner.plan(0, 39), [])
+
+    def test_goal_moves_after_doors_close(self):
+        # Closing these leaves a loop of stale parents through the new goal
+        self.graph = build_graph([
+            ".##.###",
+            "#.#....",
+            "#.#.###",
+            "...##..",
+            "..#...#",
+        ])
+        self.planner = DStarLite(self.graph)
+        self.assert_optimal(27, 23)
+        self.graph.set_walkable([21, 13], False)
+        self.graph.set_walkable([32, 29], False)
+        self.assert_optimal(26, 26)
+        self.assert_optimal(27, 33)
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pygame
 from src.entities.player import Player
 from src.entities.objects import LaserDoor
+from src.core.spatialHash import SpatialHash
 
 class TestMovement(unittest.TestCase):
     """Test the WASD movement of the player."""
@@ -28,7 +29,7 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([], [])
+        self.player.update(SpatialHash(), [])
         self.assertLess(self.player.pos.y, oldY)
     
     @patch("pygame.key.get_pressed")
@@ -42,7 +43,7 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([], [])
+        self.player.update(SpatialHash(), [])
         self.assertLess(self.player.pos.x, oldX)
 
     @patch("pygame.key.get_pressed")
@@ -56,7 +57,7 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([], [])
+        self.player.update(SpatialHash(), [])
         self.assertGreater(self.player.pos.y, oldY)
 
     @patch("pygame.key.get_pressed")
@@ -70,7 +71,7 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([], [])
+        self.player.update(SpatialHash(), [])
         self.assertGreater(self.player.pos.x, oldX)
     
     @patch("pygame.key.get_pressed")
@@ -87,7 +88,7 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([wall], [])
+        self.player.update(SpatialHash([wall]), [])
         self.assertEqual(oldX, self.player.pos.x)
     
     @patch("pygame.key.get_pressed")
@@ -108,7 +109,7 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([], [door])
+        self.player.update(SpatialHash(), [door])
         self.assertEqual(oldX, self.player.pos.x)
     
     @patch("pygame.key.get_pressed")
@@ -130,5 +131,5 @@ class TestMovement(unittest.TestCase):
             pygame.K_p: 0,
             pygame.K_k: 0
         }
-        self.player.update([], [door])
+        self.player.update(SpatialHash(), [door])
         self.assertLess(oldX, self.player.pos.x)
@@ -0,0 +1,218 @@
+"""Unit tests for the camera's drawing helpers."""
+
+import unittest
+from unittest.mock import patch
+import random
+import tempfile
+from pathlib import Path
+import pygame
+from src.core.depthOrder import DepthOrder
+from src.core.chunkedBackground import ChunkedBackground
+from src.core.spritesheet import SpriteSheet
+from src.core.atlas import shelf_pack, atlas_sources, build_atlas, Atlas
+import src.core.utils as utils
+from src.core.assetManager import AssetManager
+
+
+class TestDepthOrder(unittest.TestCase):
+    """Test keeping sprites sorted by depth as they move."""
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.sprites = []
+        for _ in range(30):
+            sprite = pygame.sprite.Sprite()
+            sprite.rect = pygame.Rect(0, rng.randrange(500), 10, 10)
+            self.sprites.append(sprite)
+        self.order = DepthOrder(self.sprites)
+
+    def assertSorted(self):
+        depths = [sprite.rect.centery for sprite in self.order]
+        self.assertEqual(depths, sorted(depths))
+        self.assertEqual(len(self.order), len(self.sprites))
+
+    def test_sorted_when_built(self):
+        self.assertSorted()
+
+    def test_update_moves_only_what_moved(self):
+        self.sprites[3].rect.y += 200
+        self.sprites[7].rect.y = -5
+        self.assertEqual(self.order.update(), 2)
+        self.assertSorted()
+        self.assertEqual(self.order.update(), 0)
+
+    def test_remove(self):
+        sprite = self.sprites.pop(5)
+        self.order.remove(sprite)
+        self.assertNotIn(sprite, self.order)
+        self.assertSorted()
+
+
+class TestChunkedBackground(unittest.TestCase):
+    """Test drawing a background from its chunks."""
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.image = pygame.Surface((300, 200))
+        for _ in range(50):
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            self.image.fill(color, (rng.randrange(300), rng.randrange(200), 40, 40))
+        self.background = ChunkedBackground(self.image, chunkSize=64)
+
+    def test_matches_blitting_the_image(self):
+        for offset, clip in [
+            ((0, 0), None),
+            ((-100.5, -37.2), None),
+            ((-250, 10), pygame.Rect(20, 30, 70, 50)),
+            ((500, 500), None),
+        ]:
+            expected = pygame.Surface((160, 120))
+            actual = pygame.Surface((160, 120))
+            expected.set_clip(clip)
+            actual.set_clip(clip)
+            expected.blit(self.image, offset)
+            self.background.draw(actual, offset)
+            self.assertEqual(
+                pygame.image.tobytes(actual, "RGB"),
+                pygame.image.tobytes(expected, "RGB")
+            )
+
+
+class TestSpriteSheet(unittest.TestCase):
+    """Test parsing frames out of a sprite sheet."""
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        sheet = pygame.Surface((32, 16))
+        sheet.fill((255, 0, 0), (0, 0, 4, 16))
+        metadata = {
+            "frame_width": 16,
+            "frame_height": 16,
+            "scale": 2,
+            "actions": {"walk": {"row": 0, "num_frames": 2, "cooldown": 100}},
+            "colorkey": (0, 0, 0)
+        }
+        with patch("src.core.utils.load_png") as mockImageLoad:
+            mockImageLoad.return_value = (sheet, sheet.get_rect())
+            self.spritesheet = SpriteSheet("", metadata)
+
+    def test_flipped_frames_are_cached(self):
+        image = self.spritesheet.get_image("walk", 0)
+        flipped = self.spritesheet.get_image("walk", 0, flipped=True)
+        self.assertIs(flipped, self.spritesheet.get_image("walk", 0, flipped=True))
+        self.assertEqual(image.get_at((0, 0)), flipped.get_at((31, 0)))
+        self.assertNotEqual(image.get_at((0, 0)), flipped.get_at((0, 0)))
+        self.assertEqual(flipped.get_colorkey(), image.get_colorkey())
+
+
+class TestAssetManager(unittest.TestCase):
+    """Test sharing loaded assets through the cache."""
+
+    def setUp(self):
+        self.saved = (AssetManager.capacity, AssetManager.hits, AssetManager.misses, AssetManager.assets.copy())
+        AssetManager.clear()
+        AssetManager.hits = AssetManager.misses = 0
+        self.metadata = {"frame_width": 16, "actions": {"walk": {"row": 0}}}
+        patcher = patch("src.core.assetManager.SpriteSheet", side_effect=lambda filename, metadata: object())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        AssetManager.capacity, AssetManager.hits, AssetManager.misses, assets = self.saved
+        AssetManager.clear()
+        AssetManager.assets.update(assets)
+
+    def test_same_key_same_asset(self):
+        sheet = AssetManager.get_spritesheet("player.png", self.metadata)
+        sameMetadata = {"actions": {"walk": {"row": 0}}, "frame_width": 16}
+        self.assertIs(AssetManager.get_spritesheet("player.png", sameMetadata), sheet)
+
+    def test_different_metadata_different_asset(self):
+        sheet = AssetManager.get_spritesheet("player.png", self.metadata)
+        otherMetadata = {"frame_width": 32, "actions": {"walk": {"row": 0}}}
+        self.assertIsNot(AssetManager.get_spritesheet("player.png", otherMetadata), sheet)
+        self.assertIsNot(AssetManager.get_spritesheet("enemy.png", self.metadata), sheet)
+
+    def test_least_recently_used_evicted(self):
+        AssetManager.capacity = 2
+        first = AssetManager.get("first", object)
+        AssetManager.get("second", object)
+        AssetManager.get("first", object)
+        AssetManager.get("third", object)
+        self.assertEqual(list(AssetManager.assets), ["first", "third"])
+        self.assertIs(AssetManager.get("first", object), first)
+        misses = AssetManager.misses
+        AssetManager.get("second", object)
+        self.assertEqual(AssetManager.misses, misses + 1)
+        self.assertEqual(list(AssetManager.assets), ["first", "second"])
+
+    def test_hit_rate(self):
+        self.assertEqual(AssetManager.hit_rate(), 0.0)
+        AssetManager.get("first", object)
+        AssetManager.get("first", object)
+        AssetManager.get("first", object)
+        AssetManager.get("second", object)
+        self.assertEqual((AssetManager.hits, AssetManager.misses), (2, 2))
+        self.assertEqual(AssetManager.hit_rate(), 0.5)
+
+
+class TestShelfPack(unittest.TestCase):
+    """Test packing images into atlas sheets."""
+
+    def test_rects_fit_without_overlapping(self):
+        rng = random.Random(0)
+        sizes = [(rng.randint(1, 120), rng.randint(1, 120)) for _ in range(200)]
+        placements = shelf_pack(sizes, 256)
+        rects = {}
+        for (width, height), (sheet, x, y) in zip(sizes, placements):
+            rect = pygame.Rect(x, y, width, height)
+            self.assertTrue(pygame.Rect(0, 0, 256, 256).contains(rect))
+            self.assertEqual(rect.collidelist(rects.get(sheet, [])), -1)
+            rects.setdefault(sheet, []).append(rect)
+        area = sum(width * height for width, height in sizes)
+        self.assertLess(len(rects), 2 * area / 256 ** 2 + 1)
+
+    def test_too_large(self):
+        with self.assertRaises(ValueError):
+            shelf_pack([(300, 10)], 256)
+
+
+class TestAtlas(unittest.TestCase):
+    """Test loading images through a freshly built atlas."""
+
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.sources = atlas_sources()[:8]
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempDir.cleanup)
+        build_atlas(self.sources, outDir=self.tempDir.name)
+        self.saved = (Atlas.directory, Atlas.manifest, Atlas.sheets)
+        Atlas.directory = Path(self.tempDir.name)
+        Atlas.clear()
+
+    def tearDown(self):
+        Atlas.directory, Atlas.manifest, Atlas.sheets = self.saved
+
+    def pixels(self, image):
+        return pygame.image.tobytes(image, "RGBA")
+
+    def test_same_pixels_as_file(self):
+        packed = {source: utils.load_png(source)[0] for source in self.sources}
+        for image in packed.values():
+            self.assertIsNotNone(image.get_parent())
+        Atlas.directory = Path(self.tempDir.name) / "missing"
+        Atlas.clear()
+        for source, image in packed.items():
+            fromFile = utils.load_png(source)[0]
+            self.assertIsNone(fromFile.get_parent())
+            self.assertEqual(image.get_size(), fromFile.get_size())
+            self.assertEqual(self.pixels(image), self.pixels(fromFile), source)
+
+    def test_changed_file_not_used(self):
+        source = self.sources[0]
+        self.assertIsNotNone(Atlas.get(source))
+        Atlas.manifest["images"][source]["mtime"] -= 1
+        self.assertIsNone(Atlas.get(source))
+        self.assertIsNone(utils.load_png(source)[0].get_parent())